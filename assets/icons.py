@@ -5,21 +5,22 @@ Provides functions for loading and using icons throughout the application.
 import os
 import base64
 import logging
-from typing import Dict, Optional, Any
+from types import SimpleNamespace
+from typing import Dict, Iterable, Optional, Any, Tuple
 
 import customtkinter as ctk
 
 logger = logging.getLogger('reimdockify.assets.icons')
 
-# Импортируем глобальную переменную для проверки режима работы
+# Импортируем глобальные флаги для проверки режима работы
 try:
-    from utils.globals import DISABLE_IMAGES
+    from utils.globals import FLAGS
 except ImportError:
     # Если не удалось импортировать, предполагаем, что изображения включены
-    DISABLE_IMAGES = False
+    FLAGS = SimpleNamespace(disable_images=False)
 
-# Dictionary to store loaded icon images
-_icon_cache = {}
+# Dictionary to store loaded icon images, keyed by (icon_name, size, color)
+_icon_cache: Dict[Tuple[str, int, str], ctk.CTkImage] = {}
 
 # SVG icon definitions
 ICONS = {
@@ -94,19 +95,15 @@ def get_icon_image(icon_name: str, size: int = 24, color: str = "#FFFFFF") -> Op
     Returns:
         CTkImage object or None if icon not found
     """
-    # Импортируем здесь, чтобы избежать проблем с циклическими импортами
-    from utils.globals import DISABLE_IMAGES
-    
     # Если изображения отключены, возвращаем None
-    if DISABLE_IMAGES:
+    if FLAGS.disable_images:
         return None
         
-    # Create a cache key
-    cache_key = f"{icon_name}_{size}_{color}"
-    
     # Check if icon is already cached
-    if cache_key in _icon_cache:
-        return _icon_cache[cache_key]
+    cache_key = (icon_name, size, color)
+    icon_image = _icon_cache.get(cache_key)
+    if icon_image is not None:
+        return icon_image
     
     # Путь к возможному файлу SVG
     svg_path = os.path.join(os.path.dirname(__file__), f"temp_{icon_name}.svg")
@@ -197,6 +194,16 @@ def get_icon_image(icon_name: str, size: int = 24, color: str = "#FFFFFF") -> Op
         except:
             return None
 
+def preload_icons(icon_specs: Iterable[Tuple[str, int, str]]) -> None:
+    """
+    Render a set of icons into the cache in one pass.
+    
+    Args:
+        icon_specs: (icon_name, size, color) tuples to render
+    """
+    for icon_name, size, color in icon_specs:
+        get_icon_image(icon_name, size=size, color=color)
+
 def get_icon_svg(icon_name: str, color: str = "currentColor") -> Optional[str]:
     """
     Get SVG data for an icon.
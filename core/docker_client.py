@@ -2,9 +2,11 @@
 Docker client wrapper for interacting with Docker API.
 """
 import os
+import time
 import logging
 import json
-from typing import Dict, List, Any, Optional, Union
+import threading
+from typing import Dict, List, Any, Optional, Tuple, Union
 import docker
 from docker.errors import DockerException
 
@@ -14,6 +16,9 @@ class DockerClient:
     """
     Wrapper around the Docker API client to provide simplified access to Docker resources.
     """
+    # Maximum age of a cached container listing, in seconds
+    LIST_CACHE_TTL = 2.0
+    
     def __init__(self, socket_path: str = '/var/run/docker.sock'):
         """
         Initialize the Docker client.
@@ -21,6 +26,10 @@ class DockerClient:
         Args:
             socket_path: Path to Docker socket (default: /var/run/docker.sock)
         """
+        # Short-lived container listing cache shared by all views, keyed by all_containers
+        self._list_cache: Dict[bool, Tuple[float, List[Dict[str, Any]]]] = {}
+        self._list_lock = threading.Lock()
+        
         self.socket_path = socket_path
         self._initialize_client()
         
@@ -85,7 +94,12 @@ class DockerClient:
         # Если клиент уже был инициализирован, переинициализируем его
         if hasattr(self, 'client'):
             logger.info(f"Updating Docker socket path to {path}")
+            self.invalidate_container_cache()
             self._initialize_client()
+            
+    def invalidate_container_cache(self) -> None:
+        """Drop the cached container listing so the next call hits the daemon."""
+        self._list_cache.clear()
 
     def list_containers(self, all_containers: bool = True) -> List[Dict[str, Any]]:
         """
@@ -97,29 +111,54 @@ class DockerClient:
         Returns:
             List of container dictionaries
         """
-        try:
-            containers = self.client.containers.list(all=all_containers)
-            # Convert Container objects to dictionaries with necessary attributes
-            container_dicts = []
-            for container in containers:
-                # Build a dictionary with the required attributes
-                container_dict = {
-                    'Id': container.id,
-                    'Names': [container.name],
-                    'Image': container.image.tags[0] if container.image.tags else container.image.id,
-                    'ImageID': container.image.id,
-                    'State': container.status,
-                    'Status': container.status,
-                    'Created': container.attrs.get('Created', ''),
-                    'Ports': self._extract_ports(container),
-                    'Labels': container.labels,
-                    'Command': container.attrs.get('Config', {}).get('Cmd', [])
-                }
-                container_dicts.append(container_dict)
-            return container_dicts
-        except DockerException as e:
-            logger.error(f"Failed to list containers: {e}")
-            return []
+        cached = self._list_cache.get(all_containers)
+        if cached and time.monotonic() - cached[0] < self.LIST_CACHE_TTL:
+            return list(cached[1])
+            
+        # Only one caller refreshes the listing, concurrent callers reuse its result
+        with self._list_lock:
+            cached = self._list_cache.get(all_containers)
+            if cached and time.monotonic() - cached[0] < self.LIST_CACHE_TTL:
+                return list(cached[1])
+                
+            try:
+                container_dicts = self._fetch_containers(all_containers)
+            except DockerException as e:
+                logger.error(f"Failed to list containers: {e}")
+                return []
+                
+            self._list_cache[all_containers] = (time.monotonic(), container_dicts)
+            return list(container_dicts)
+            
+    def _fetch_containers(self, all_containers: bool) -> List[Dict[str, Any]]:
+        """
+        Fetch the container list from the Docker daemon.
+        
+        Args:
+            all_containers: Whether to include stopped containers
+            
+        Returns:
+            List of container dictionaries
+        """
+        containers = self.client.containers.list(all=all_containers)
+        # Convert Container objects to dictionaries with necessary attributes
+        container_dicts = []
+        for container in containers:
+            # Build a dictionary with the required attributes
+            container_dict = {
+                'Id': container.id,
+                'Names': [container.name],
+                'Image': container.image.tags[0] if container.image.tags else container.image.id,
+                'ImageID': container.image.id,
+                'State': container.status,
+                'Status': container.status,
+                'Created': container.attrs.get('Created', ''),
+                'Ports': self._extract_ports(container),
+                'Labels': container.labels,
+                'Command': container.attrs.get('Config', {}).get('Cmd', [])
+            }
+            container_dicts.append(container_dict)
+        return container_dicts
             
     def _extract_ports(self, container) -> List[Dict[str, Any]]:
         """Extract port information from container attributes."""
@@ -173,6 +212,7 @@ class DockerClient:
             container = self.client.containers.get(container_id)
             container.start()
             logger.info(f"Container {container_id} started")
+            self.invalidate_container_cache()
             return True
         except DockerException as e:
             logger.error(f"Failed to start container {container_id}: {e}")
@@ -192,6 +232,7 @@ class DockerClient:
             container = self.client.containers.get(container_id)
             container.stop()
             logger.info(f"Container {container_id} stopped")
+            self.invalidate_container_cache()
             return True
         except DockerException as e:
             logger.error(f"Failed to stop container {container_id}: {e}")
@@ -211,6 +252,7 @@ class DockerClient:
             container = self.client.containers.get(container_id)
             container.restart()
             logger.info(f"Container {container_id} restarted")
+            self.invalidate_container_cache()
             return True
         except DockerException as e:
             logger.error(f"Failed to restart container {container_id}: {e}")
@@ -231,6 +273,7 @@ class DockerClient:
             container = self.client.containers.get(container_id)
             container.remove(force=force)
             logger.info(f"Container {container_id} removed")
+            self.invalidate_container_cache()
             return True
         except DockerException as e:
             logger.error(f"Failed to remove container {container_id}: {e}")
@@ -6,12 +6,16 @@ import threading
 import logging
 from typing import Dict, List, Any, Optional, Callable
 import psutil
+import numpy as np
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from core.docker_client import DockerClient
 
 logger = logging.getLogger('dockify.monitor')
 
+# Numeric metric fields exposed as parallel columns by get_metrics_history_columns
+METRIC_COLUMNS = ('timestamp', 'cpu_percent', 'memory_percent', 'memory_usage', 'network_rx', 'network_tx')
+
 class ContainerMonitor:
     """
     Monitors Docker containers and collects metrics at regular intervals.
@@ -280,6 +284,26 @@ class ContainerMonitor:
         """
         return self.metrics_history.get(container_id, [])
         
+    def get_metrics_history_columns(self, container_id: str) -> Dict[str, np.ndarray]:
+        """
+        Get historical metrics for a specific container as parallel columns.
+        
+        Missing fields are stored as 0, so consumers can index the columns directly.
+        
+        Args:
+            container_id: The ID of the container
+            
+        Returns:
+            Mapping of METRIC_COLUMNS names to float64 arrays of equal length, ordered by timestamp
+        """
+        # Снимок списка: поток мониторинга может дописать точку во время построения колонок
+        history = list(self.metrics_history.get(container_id, []))
+        count = len(history)
+        return {
+            field: np.fromiter((m.get(field, 0) for m in history), dtype=np.float64, count=count)
+            for field in METRIC_COLUMNS
+        }
+        
     def get_system_metrics(self) -> Dict[str, Any]:
         """
         Get system-wide metrics.
@@ -3,7 +3,7 @@
 """
 import datetime
 import logging
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
 from sqlalchemy.orm import Session
 from sqlalchemy import desc
@@ -92,6 +92,30 @@ class ReportService:
             logger.error(f"Error getting reports for user {user_id}: {e}")
             return []
     
+    def get_reports_projection_by_user(self, user_id: int, 
+                                       limit: int = 10) -> List[Tuple[int, str, datetime.datetime]]:
+        """
+        Получить только id, путь к файлу и дату создания отчетов пользователя.
+        
+        Выбирает нужные столбцы одним запросом без создания ORM-объектов.
+        
+        Args:
+            user_id: ID пользователя
+            limit: Максимальное количество отчетов
+            
+        Returns:
+            List[Tuple[int, str, datetime.datetime]]: Список кортежей (id, file_path, created_at)
+        """
+        try:
+            return self.db.query(Report.id, Report.file_path, Report.created_at)\
+                .filter(Report.user_id == user_id)\
+                .order_by(desc(Report.created_at))\
+                .limit(limit)\
+                .all()
+        except Exception as e:
+            logger.error(f"Error getting reports for user {user_id}: {e}")
+            return []
+    
     def get_report_by_id(self, report_id: int) -> Optional[Report]:
         """
         Получить отчет по ID.
@@ -131,6 +155,31 @@ class ReportService:
             logger.error(f"Error deleting report {report_id}: {e}")
             return False
     
+    def delete_reports(self, report_ids: List[int]) -> int:
+        """
+        Удалить несколько отчетов одним запросом.
+        
+        Args:
+            report_ids: Список ID отчетов
+            
+        Returns:
+            int: Количество удаленных отчетов
+        """
+        if not report_ids:
+            return 0
+            
+        try:
+            result = self.db.query(Report)\
+                .filter(Report.id.in_(report_ids))\
+                .delete(synchronize_session=False)
+            self.db.commit()
+            logger.info(f"Deleted {result} reports")
+            return result
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Error deleting reports {report_ids}: {e}")
+            return 0
+    
     def update_report(self, report_id: int, **kwargs) -> Optional[Report]:
         """
         Обновить отчет.
@@ -5,11 +5,15 @@ import logging
 import time
 import tkinter as tk
 from tkinter import filedialog, messagebox
-from typing import Dict, List, Any, Optional, Callable
-import threading
+from typing import Dict, List, Set, Any, Optional, Callable
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 import os
+import sys
+import subprocess
 import calendar
+import functools
+from operator import itemgetter
 
 import customtkinter as ctk
 
@@ -25,6 +29,61 @@ from db.services.report_service import ReportService
 
 logger = logging.getLogger('dockify.ui.reports')
 
+# Производные цвета темы вычисляются один раз при импорте, а не для каждого виджета
+_ACCENT_HOVER = lighten_color(SPOTIFY_COLORS["accent"], 0.1)
+_GREEN_HOVER = lighten_color(SPOTIFY_COLORS["accent_green"], 0.1)
+_BLUE_HOVER = lighten_color(SPOTIFY_COLORS["accent_blue"], 0.1)
+_CARD_SCALED = scale_color(SPOTIFY_COLORS["card_background"], 1.1)
+_CARD_HISTORY = scale_color(SPOTIFY_COLORS["card_background"], 1.05)
+_CARD_PROGRESS = scale_color(SPOTIFY_COLORS["card_background"], 1.2)
+
+# Platform-specific file opener, resolved once; Popen does not block the Tk main loop
+if sys.platform == 'win32':
+    _OPEN_FILE = os.startfile
+elif sys.platform == 'darwin':  # macOS
+    _OPEN_FILE = lambda path: subprocess.Popen(('open', path))
+else:  # Linux
+    _OPEN_FILE = lambda path: subprocess.Popen(('xdg-open', path))
+
+# Открытые границы диапазонов округляются до 5 минут, чтобы повторные отчеты давали тот же ключ кэша
+DATE_RANGE_BUCKET_MINUTES = 5
+
+def _floor_to_bucket(moment: datetime.datetime) -> datetime.datetime:
+    """Round a datetime down to the start of its date range bucket."""
+    return moment.replace(second=0, microsecond=0) - datetime.timedelta(
+        minutes=moment.minute % DATE_RANGE_BUCKET_MINUTES
+    )
+
+def _ceil_to_bucket(moment: datetime.datetime) -> datetime.datetime:
+    """Round a datetime up to the end of its date range bucket."""
+    floored = _floor_to_bucket(moment)
+    if floored == moment:
+        return moment
+    return floored + datetime.timedelta(minutes=DATE_RANGE_BUCKET_MINUTES)
+
+def _today_range(now: datetime.datetime) -> tuple:
+    """Today, midnight to now."""
+    return now.replace(hour=0, minute=0, second=0, microsecond=0), _ceil_to_bucket(now)
+
+def _yesterday_range(now: datetime.datetime) -> tuple:
+    """Yesterday, midnight to midnight."""
+    yesterday = now - datetime.timedelta(days=1)
+    return (
+        yesterday.replace(hour=0, minute=0, second=0, microsecond=0),
+        yesterday.replace(hour=23, minute=59, second=59, microsecond=0)
+    )
+
+def _last_7_days_range(now: datetime.datetime) -> tuple:
+    """Last 7 days up to now."""
+    return _floor_to_bucket(now - datetime.timedelta(days=7)), _ceil_to_bucket(now)
+
+# Preset time range options -> (start_date, end_date) builders
+_RANGE_HANDLERS = {
+    "Today": _today_range,
+    "Yesterday": _yesterday_range,
+    "Last 7 days": _last_7_days_range,
+}
+
 class ReportsFrame(ctk.CTkFrame):
     """
     Reports generation screen for exporting container metrics.
@@ -47,7 +106,18 @@ class ReportsFrame(ctk.CTkFrame):
         self.exporter = MetricsExporter(self.container_monitor)
         
         # Currently selected containers
-        self.selected_containers: List[str] = []
+        self.selected_containers: Set[str] = set()
+        
+        # Shared workers for background loading; a newer refresh cancels loads that have not started yet
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="reports")
+        
+        # Single worker for report generation: repeated clicks queue up instead of spawning threads
+        self._report_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="report-export")
+        self._history_future = None
+        self._containers_future = None
+        
+        # Директория отчетов по умолчанию, вычисляется один раз
+        self.reports_dir = os.path.join(os.path.expanduser("~"), "dockify_reports")
         
         # Получаем ID пользователя из родительского окна
         self.user_id = getattr(parent, 'user_id', 0)
@@ -143,36 +213,38 @@ class ReportsFrame(ctk.CTkFrame):
         # Container selection frame
         self.container_selection_frame = ctk.CTkFrame(
             self.report_config_frame,
-            fg_color=scale_color(SPOTIFY_COLORS["card_background"], 1.1),
+            fg_color=_CARD_SCALED,
             corner_radius=5
         )
         self.container_selection_frame.grid(row=1, column=1, sticky="ew", padx=0, pady=(0, 10))
         
-        # Container list scrollable frame
-        self.container_list = ctk.CTkScrollableFrame(
-            self.container_selection_frame,
-            fg_color="transparent",
-            height=150
-        )
-        self.container_list.pack(fill="x", expand=True, padx=10, pady=10)
-        
         # Select all button
         self.select_all_var = tk.BooleanVar(value=False)
         self.select_all_checkbox = ctk.CTkCheckBox(
-            self.container_list,
+            self.container_selection_frame,
             text="Select All",
             font=("Helvetica", 12),
             text_color=SPOTIFY_COLORS["text_bright"],
             fg_color=SPOTIFY_COLORS["accent"],
-            hover_color=lighten_color(SPOTIFY_COLORS["accent"], 0.1),
+            hover_color=_ACCENT_HOVER,
             variable=self.select_all_var,
             command=self.toggle_select_all,
             checkbox_width=20,
             checkbox_height=20
         )
-        self.select_all_checkbox.pack(anchor="w", padx=5, pady=(0, 10))
+        self.select_all_checkbox.pack(anchor="w", padx=15, pady=(10, 0))
+        
+        # Virtualized container list (rows are drawn only for the visible viewport)
+        self.container_list = ContainerCheckList(
+            self.container_selection_frame,
+            height=150,
+            bg_color=_CARD_SCALED,
+            command=self.toggle_container,
+            is_selected=lambda container_id: container_id in self.selected_containers
+        )
+        self.container_list.pack(fill="x", expand=True, padx=10, pady=10)
         
-        # Container checkboxes will be added dynamically
+        # Container info (display name, state) keyed by container ID
         self.container_checkboxes = {}
         
         # Time range selection
@@ -244,57 +316,8 @@ class ReportsFrame(ctk.CTkFrame):
         )
         self.time_custom_radio.grid(row=0, column=3, sticky="w", padx=0, pady=0)
         
-        # Custom date range
-        self.custom_date_frame = ctk.CTkFrame(
-            self.time_range_frame,
-            fg_color="transparent"
-        )
-        self.custom_date_frame.grid(row=1, column=0, columnspan=4, sticky="ew", padx=0, pady=(10, 0))
-        
-        # Start date
-        self.start_date_label = ctk.CTkLabel(
-            self.custom_date_frame,
-            text="Start date:",
-            font=("Helvetica", 12),
-            text_color=SPOTIFY_COLORS["text_subtle"],
-            width=80,
-            anchor="w"
-        )
-        self.start_date_label.grid(row=0, column=0, sticky="w", padx=(0, 5), pady=0)
-        
-        # Use current date as default
-        current_date = datetime.datetime.now()
-        default_date = current_date.strftime("%Y-%m-%d")
-        
-        self.start_date_selector = DateSelector(
-            self.custom_date_frame,
-            label="Start date",
-            default_date=default_date,
-            width=150
-        )
-        self.start_date_selector.grid(row=0, column=1, sticky="w", padx=(0, 20), pady=0)
-        
-        # End date
-        self.end_date_label = ctk.CTkLabel(
-            self.custom_date_frame,
-            text="End date:",
-            font=("Helvetica", 12),
-            text_color=SPOTIFY_COLORS["text_subtle"],
-            width=80,
-            anchor="w"
-        )
-        self.end_date_label.grid(row=0, column=2, sticky="w", padx=(0, 5), pady=0)
-        
-        self.end_date_selector = DateSelector(
-            self.custom_date_frame,
-            label="End date",
-            default_date=default_date,
-            width=150
-        )
-        self.end_date_selector.grid(row=0, column=3, sticky="w", padx=0, pady=0)
-        
-        # Initially hide custom date range
-        self.custom_date_frame.grid_remove()
+        # Custom date range widgets are built on first use of "Custom range"
+        self.custom_date_frame = None
         
         # Report format
         self.format_label = ctk.CTkLabel(
@@ -322,7 +345,8 @@ class ReportsFrame(ctk.CTkFrame):
             text_color=SPOTIFY_COLORS["text_bright"],
             fg_color=SPOTIFY_COLORS["accent"],
             variable=self.format_var,
-            value="Excel"
+            value="Excel",
+            command=self._update_writer
         )
         self.format_excel_radio.grid(row=0, column=0, sticky="w", padx=(0, 20), pady=0)
         
@@ -333,7 +357,8 @@ class ReportsFrame(ctk.CTkFrame):
             text_color=SPOTIFY_COLORS["text_bright"],
             fg_color=SPOTIFY_COLORS["accent"],
             variable=self.format_var,
-            value="CSV"
+            value="CSV",
+            command=self._update_writer
         )
         self.format_csv_radio.grid(row=0, column=1, sticky="w", padx=(0, 20), pady=0)
         
@@ -345,13 +370,17 @@ class ReportsFrame(ctk.CTkFrame):
             font=("Helvetica", 12),
             text_color=SPOTIFY_COLORS["text_bright"],
             fg_color=SPOTIFY_COLORS["accent"],
-            hover_color=lighten_color(SPOTIFY_COLORS["accent"], 0.1),
+            hover_color=_ACCENT_HOVER,
             variable=self.include_graphs_var,
+            command=self._update_writer,
             checkbox_width=20,
             checkbox_height=20
         )
         self.include_graphs_checkbox.grid(row=0, column=2, sticky="w", padx=0, pady=0)
         
+        # Exporter method for the current format, rebound only when the options change
+        self._update_writer()
+        
         # Actions
         self.actions_frame = ctk.CTkFrame(
             self.content_frame,
@@ -366,7 +395,7 @@ class ReportsFrame(ctk.CTkFrame):
             text="Generate Report",
             font=("Helvetica", 14, "bold"),
             fg_color=SPOTIFY_COLORS["accent_green"],
-            hover_color=lighten_color(SPOTIFY_COLORS["accent_green"], 0.1),
+            hover_color=_GREEN_HOVER,
             text_color=SPOTIFY_COLORS["text_bright"],
             width=200,
             height=40,
@@ -380,7 +409,7 @@ class ReportsFrame(ctk.CTkFrame):
             text="Refresh Containers",
             font=("Helvetica", 14),
             fg_color=SPOTIFY_COLORS["accent_blue"],
-            hover_color=lighten_color(SPOTIFY_COLORS["accent_blue"], 0.1),
+            hover_color=_BLUE_HOVER,
             text_color=SPOTIFY_COLORS["text_bright"],
             width=180,
             height=40,
@@ -391,7 +420,7 @@ class ReportsFrame(ctk.CTkFrame):
         # Report history section
         self.history_frame = ctk.CTkFrame(
             self.content_frame,
-            fg_color=scale_color(SPOTIFY_COLORS["card_background"], 1.05),
+            fg_color=_CARD_HISTORY,
             corner_radius=5
         )
         self.history_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
@@ -420,6 +449,7 @@ class ReportsFrame(ctk.CTkFrame):
             text_color=SPOTIFY_COLORS["text_subtle"]
         )
         self.no_reports_label.pack(pady=20)
+        self._no_reports_visible = True
         
         # Prepare report history items list
         self.report_history_items = []
@@ -427,9 +457,6 @@ class ReportsFrame(ctk.CTkFrame):
     def refresh(self):
         """Refresh container list and report history."""
         try:
-            # Показываем содержимое фрейма сразу
-            self.update_idletasks()
-            
             # Обновляем метку времени обновления
             self.refresh_label.configure(text=f"Last updated: {time.strftime('%H:%M:%S')}")
             
@@ -445,31 +472,22 @@ class ReportsFrame(ctk.CTkFrame):
             )
             loading_label.place(relx=0.5, rely=0.3, anchor="center")
             
-            # Загружаем историю отчетов в фоновом потоке
-            threading.Thread(target=self.load_report_history_thread, daemon=True).start()
+            # Отменяем загрузки предыдущего обновления, которые еще не начались
+            for future in (self._history_future, self._containers_future):
+                if future is not None:
+                    future.cancel()
+            
+            # Загружаем историю отчетов и контейнеры в фоновых потоках
+            self._history_future = self._executor.submit(self.load_report_history_thread)
+            self._containers_future = self._executor.submit(self.load_containers)
             
-            # Загружаем контейнеры в фоновом потоке
-            threading.Thread(
-                target=lambda: self.load_containers_with_cleanup(loading_label), 
-                daemon=True
-            ).start()
+            # Удаляем индикатор загрузки, когда загрузка завершена или отменена
+            self._containers_future.add_done_callback(lambda future: self.after(0, loading_label.destroy))
             
         except Exception as e:
             logger.error(f"Error refreshing reports view: {e}")
             self.refresh_button.configure(state="normal", text="Refresh Containers")
             
-    def load_containers_with_cleanup(self, loading_label):
-        """Загружает контейнеры и удаляет индикатор загрузки."""
-        try:
-            # Загружаем контейнеры
-            self.load_containers()
-            
-            # Удаляем индикатор загрузки
-            self.after(0, loading_label.destroy)
-        except Exception as e:
-            logger.error(f"Error in load_containers_with_cleanup: {e}")
-            self.after(0, loading_label.destroy)
-            
     def load_report_history_thread(self):
         """Загружает историю отчетов в отдельном потоке."""
         try:
@@ -488,44 +506,52 @@ class ReportsFrame(ctk.CTkFrame):
         # Если есть сервис отчетов и ID пользователя, загружаем отчеты из базы данных
         if self.report_service and self.user_id > 0:
             try:
-                # Получаем отчеты пользователя из базы данных
-                db_reports = self.report_service.get_reports_by_user(self.user_id, limit=10)
+                # Получаем только нужные столбцы отчетов пользователя
+                db_reports = self.report_service.get_reports_projection_by_user(self.user_id, limit=10)
                 
                 # Добавляем отчеты из базы данных в список
-                for report in db_reports:
+                missing_report_ids = []
+                for report_id, file_path, created_at in db_reports:
                     # Проверяем, что файл отчета существует
-                    if report.file_path and os.path.exists(report.file_path):
+                    if file_path and os.path.exists(file_path):
                         report_files.append({
-                            "name": os.path.basename(report.file_path),
-                            "path": report.file_path,
-                            "modified": report.created_at.timestamp(),
+                            "name": os.path.basename(file_path),
+                            "path": file_path,
+                            "modified": created_at.timestamp(),
                             "db_record": True,
-                            "report_id": report.id
+                            "report_id": report_id
                         })
                     else:
-                        # Если файл не существует, удаляем запись из базы данных
-                        logger.warning(f"Report file not found: {report.file_path}")
-                        self.report_service.delete_report(report.id)
+                        logger.warning(f"Report file not found: {file_path}")
+                        missing_report_ids.append(report_id)
+                        
+                # Удаляем записи об отсутствующих файлах одним запросом
+                if missing_report_ids:
+                    self.report_service.delete_reports(missing_report_ids)
             except Exception as e:
                 logger.error(f"Error loading reports from database: {e}")
         
         # Также загружаем отчеты из директории (для обратной совместимости)
-        reports_dir = os.path.join(os.path.expanduser("~"), "dockify_reports")
+        reports_dir = self.reports_dir
         
         # Check if directory exists
         if os.path.exists(reports_dir):
+            # Пути, уже добавленные из базы данных
+            known_paths = {r["path"] for r in report_files}
+            
             for file in os.listdir(reports_dir):
-                if file.endswith(".xlsx") or file.endswith(".csv"):
+                if file.endswith((".xlsx", ".csv", ".zip")):
                     file_path = os.path.join(reports_dir, file)
                     
                     # Проверяем, что этот файл еще не добавлен из базы данных
-                    if not any(r.get("path") == file_path for r in report_files):
+                    if file_path not in known_paths:
                         report_files.append({
                             "name": file,
                             "path": file_path,
                             "modified": os.path.getmtime(file_path),
                             "db_record": False
                         })
+                        known_paths.add(file_path)
         
         # Sort by modification time (newest first)
         report_files.sort(key=lambda x: x["modified"], reverse=True)
@@ -534,28 +560,35 @@ class ReportsFrame(ctk.CTkFrame):
     def update_report_history_ui(self, report_files):
         """Обновляет UI с историей отчетов."""
         try:
-            # Clear existing report history items
-            for item in self.report_history_items:
-                item.destroy()
-            self.report_history_items = []
+            # Prepare item data for the last 10 reports before touching widgets
+            fromtimestamp = datetime.datetime.fromtimestamp
+            prepared = [
+                (report["name"], fromtimestamp(report["modified"]), report["path"])
+                for report in report_files[:10]
+            ]
             
-            # Add report items
-            for report in report_files[:10]:  # Show last 10 reports
-                report_item = ReportHistoryItem(
-                    self.history_list,
-                    report["name"],
-                    datetime.datetime.fromtimestamp(report["modified"]),
-                    report["path"]
-                )
-                report_item.pack(fill="x", padx=5, pady=3)
-                self.report_history_items.append(report_item)
+            # Reuse existing items, create only the missing ones
+            for i, item_data in enumerate(prepared):
+                if i < len(self.report_history_items):
+                    self.report_history_items[i].update_report(*item_data)
+                else:
+                    report_item = ReportHistoryItem(self.history_list, *item_data)
+                    report_item.pack(fill="x", padx=5, pady=3)
+                    self.report_history_items.append(report_item)
+                    
+            # Destroy items that are no longer needed
+            if len(prepared) < len(self.report_history_items):
+                for item in self.report_history_items[len(prepared):]:
+                    item.destroy()
+                del self.report_history_items[len(prepared):]
                 
             # Show/hide no reports message
-            if report_files:
-                if hasattr(self, 'no_reports_label') and self.no_reports_label.winfo_exists():
-                    self.no_reports_label.pack_forget()
-            else:
+            if report_files and self._no_reports_visible:
+                self.no_reports_label.pack_forget()
+                self._no_reports_visible = False
+            elif not report_files and not self._no_reports_visible:
                 self.no_reports_label.pack(pady=20)
+                self._no_reports_visible = True
                 
         except Exception as e:
             logger.error(f"Error updating report history UI: {e}")
@@ -568,105 +601,75 @@ class ReportsFrame(ctk.CTkFrame):
             # Get containers
             containers = self.docker_client.list_containers()
             
+            # Prepare list rows here so the main thread only swaps them in
+            container_info, rows = self.prepare_container_rows(containers)
+            
             # Update UI in main thread
-            self.after(0, lambda: self.update_container_list(containers))
+            self.after(0, lambda: self.update_container_list(container_info, rows))
             self.after(0, lambda: self.refresh_button.configure(state="normal", text="Refresh Containers"))
         except Exception as e:
             logger.error(f"Error loading containers: {e}")
             self.after(0, lambda: self.refresh_button.configure(state="normal", text="Refresh Containers"))
             
-    def update_container_list(self, containers):
+    def prepare_container_rows(self, containers):
         """
-        Update the container list with checkboxes.
+        Build container info and sorted list rows from raw container data.
+        
+        Runs in the loader thread, so it must not touch any Tk widgets.
         
         Args:
             containers: List of container dictionaries
-        """
-        try:
-            # Очищаем существующие чекбоксы контейнеров
-            for checkbox_info in self.container_checkboxes.values():
-                if isinstance(checkbox_info, dict) and "widget" in checkbox_info and hasattr(checkbox_info["widget"], 'destroy'):
-                    checkbox_info["widget"].destroy()
-                elif hasattr(checkbox_info, 'destroy'):
-                    checkbox_info.destroy()
-            self.container_checkboxes = {}
             
-            # Создаем словарь контейнеров
-            container_map = {}
-            container_states = {}
-            
-            # Обновляем интерфейс, чтобы показать прогресс
-            self.update_idletasks()
-            
-            for container in containers:
+        Returns:
+            Tuple of (container info keyed by ID, list of (container_id, display_name, is_running) rows)
+        """
+        # Собираем строки за один проход: (display_name, container_id, is_running)
+        entries = []
+        for container in containers:
+            container_name = container.get('Names', [''])[0].lstrip('/')
+            if container_name:
                 container_id = container.get('Id', '')
-                container_name = container.get('Names', [''])[0].lstrip('/')
-                container_state = container.get('State', '').lower()
-                
-                if container_name:
-                    display_name = f"{container_name} ({container_id[:12]})"
-                    container_map[container_id] = display_name
-                    container_states[container_id] = container_state
-                    
-            # Сортируем контейнеры по имени
-            sorted_container_ids = sorted(container_map.keys(), key=lambda cid: container_map[cid])
-            
-            # Создаем все чекбоксы сразу, но не добавляем их в интерфейс
-            checkboxes = []
-            for container_id in sorted_container_ids:
-                display_name = container_map[container_id]
-                is_running = container_states[container_id] == 'running'
+                entries.append((
+                    f"{container_name} ({container_id[:12]})",
+                    container_id,
+                    container.get('State', '').lower() == 'running'
+                ))
                 
-                # Создаем переменную
-                var = tk.BooleanVar(value=False)
-                
-                # Создаем чекбокс
-                checkbox = ctk.CTkCheckBox(
-                    self.container_list,
-                    text=display_name,
-                    font=("Helvetica", 12),
-                    text_color=SPOTIFY_COLORS["text_bright"] if is_running else SPOTIFY_COLORS["text_subtle"],
-                    fg_color=SPOTIFY_COLORS["accent"],
-                    hover_color=lighten_color(SPOTIFY_COLORS["accent"], 0.1),
-                    variable=var,
-                    command=lambda cid=container_id: self.toggle_container(cid),
-                    checkbox_width=20,
-                    checkbox_height=20
-                )
-                
-                # Сохраняем чекбокс
-                self.container_checkboxes[container_id] = {
-                    "widget": checkbox,
-                    "variable": var,
-                    "display_name": display_name,
-                    "is_running": is_running
-                }
-                
-                # Добавляем в список для пакетного добавления
-                checkboxes.append((checkbox, container_id))
+        # Сортируем контейнеры по имени
+        entries.sort(key=itemgetter(0))
+        
+        # Формируем строки виртуального списка
+        container_info = {}
+        rows = []
+        for display_name, container_id, is_running in entries:
+            container_info[container_id] = {
+                "display_name": display_name,
+                "is_running": is_running
+            }
+            rows.append((container_id, display_name, is_running))
             
-            # Обновляем интерфейс, чтобы показать прогресс
-            self.update_idletasks()
-            
-            # Добавляем все чекбоксы в интерфейс одним пакетом
-            for checkbox, _ in checkboxes:
-                checkbox.pack(anchor="w", padx=5, pady=2)
+        return container_info, rows
+        
+    def update_container_list(self, container_info, rows):
+        """
+        Update the container list with prepared rows.
+        
+        Args:
+            container_info: Container display name and state keyed by container ID
+            rows: List of (container_id, display_name, is_running) tuples
+        """
+        try:
+            # Подменяем словарь целиком, чтобы фоновые потоки не видели его частично заполненным
+            self.container_checkboxes = container_info
                 
             # Сбрасываем выбранные контейнеры
-            self.selected_containers = []
+            self.selected_containers = set()
             
             # Сбрасываем "выбрать все"
             self.select_all_var.set(False)
             
-            # Показываем сообщение, если нет контейнеров
-            if not containers:
-                self.no_containers_label = ctk.CTkLabel(
-                    self.container_list,
-                    text="No containers available",
-                    font=("Helvetica", 12),
-                    text_color=SPOTIFY_COLORS["text_subtle"]
-                )
-                self.no_containers_label.pack(pady=20)
+            # Отрисовываем только видимые строки
+            self.container_list.set_rows(rows)
             
             # Восстанавливаем кнопку обновления
             self.refresh_button.configure(state="normal", text="Refresh Containers")
@@ -683,20 +686,16 @@ class ReportsFrame(ctk.CTkFrame):
             container_id: Container ID
         """
         try:
-            # Get checkbox state
-            is_selected = self.container_checkboxes[container_id]["variable"].get()
-            
-            # Update selected containers list
-            if is_selected and container_id not in self.selected_containers:
-                self.selected_containers.append(container_id)
-            elif not is_selected and container_id in self.selected_containers:
-                self.selected_containers.remove(container_id)
+            # Update selected containers set
+            if container_id in self.selected_containers:
+                self.selected_containers.discard(container_id)
+            else:
+                self.selected_containers.add(container_id)
                 
             # Update select all checkbox
-            if all(info["variable"].get() for info in self.container_checkboxes.values()):
-                self.select_all_var.set(True)
-            else:
-                self.select_all_var.set(False)
+            self.select_all_var.set(len(self.selected_containers) == len(self.container_checkboxes))
+                
+            self.container_list.redraw()
                 
         except Exception as e:
             logger.error(f"Error toggling container selection: {e}")
@@ -710,25 +709,14 @@ class ReportsFrame(ctk.CTkFrame):
             # Log the operation
             logger.debug(f"Toggle select all: {select_all}")
             
-            # Update selected containers list immediately to maintain consistency
+            # Update selected containers set
             if select_all:
-                self.selected_containers = list(self.container_checkboxes.keys())
+                self.selected_containers = set(self.container_checkboxes)
             else:
-                self.selected_containers = []
+                self.selected_containers = set()
             
-            # Update all container checkboxes - do this last to ensure UI reflects the state
-            for container_id, info in self.container_checkboxes.items():
-                if isinstance(info, dict):
-                    # Set the variable value first
-                    if "variable" in info:
-                        info["variable"].set(select_all)
-                    
-                    # Then update the checkbox widget directly
-                    if "widget" in info:
-                        if select_all:
-                            info["widget"].select()
-                        else:
-                            info["widget"].deselect()
+            # Redraw visible rows to reflect the new state
+            self.container_list.redraw()
                             
             # Log the selected containers after the operation
             logger.debug(f"Selected containers after toggle: {len(self.selected_containers)}")
@@ -736,31 +724,95 @@ class ReportsFrame(ctk.CTkFrame):
         except Exception as e:
             logger.error(f"Error toggling select all: {e}")
             
+    def _update_writer(self):
+        """Bind the exporter method matching the selected format and graphs option."""
+        if self.format_var.get() == "Excel":
+            if self.include_graphs_var.get():
+                self._writer = functools.partial(self.exporter.export_to_excel, include_graphs=True)
+            else:
+                # Tabular-only workbooks are streamed as raw sheet XML
+                self._writer = self.exporter.export_to_excel_raw
+        else:
+            self._writer = self.exporter.export_to_csv
+            
+    def create_custom_date_frame(self):
+        """Create the custom date range widgets below the time range options."""
+        self.custom_date_frame = ctk.CTkFrame(
+            self.time_range_frame,
+            fg_color="transparent"
+        )
+        self.custom_date_frame.grid(row=1, column=0, columnspan=4, sticky="ew", padx=0, pady=(10, 0))
+        
+        # Start date
+        self.start_date_label = ctk.CTkLabel(
+            self.custom_date_frame,
+            text="Start date:",
+            font=("Helvetica", 12),
+            text_color=SPOTIFY_COLORS["text_subtle"],
+            width=80,
+            anchor="w"
+        )
+        self.start_date_label.grid(row=0, column=0, sticky="w", padx=(0, 5), pady=0)
+        
+        # Use current date as default
+        current_date = datetime.datetime.now()
+        default_date = current_date.strftime("%Y-%m-%d")
+        
+        self.start_date_selector = DateSelector(
+            self.custom_date_frame,
+            label="Start date",
+            default_date=default_date,
+            width=150
+        )
+        self.start_date_selector.grid(row=0, column=1, sticky="w", padx=(0, 20), pady=0)
+        
+        # End date
+        self.end_date_label = ctk.CTkLabel(
+            self.custom_date_frame,
+            text="End date:",
+            font=("Helvetica", 12),
+            text_color=SPOTIFY_COLORS["text_subtle"],
+            width=80,
+            anchor="w"
+        )
+        self.end_date_label.grid(row=0, column=2, sticky="w", padx=(0, 5), pady=0)
+        
+        self.end_date_selector = DateSelector(
+            self.custom_date_frame,
+            label="End date",
+            default_date=default_date,
+            width=150
+        )
+        self.end_date_selector.grid(row=0, column=3, sticky="w", padx=0, pady=0)
+        
     def toggle_custom_date_range(self):
         """Show/hide custom date range based on radio button selection."""
         try:
             logger.info(f"Toggle custom date range: {self.time_range_var.get()}")
             if self.time_range_var.get() == "Custom range":
                 # Show custom date range
-                self.custom_date_frame.grid()
+                if self.custom_date_frame is None:
+                    self.create_custom_date_frame()
+                else:
+                    self.custom_date_frame.grid()
                 
                 # Make sure date selectors are properly initialized with current date
-                current_date = datetime.datetime.now().strftime("%Y-%m-%d")
+                now = datetime.datetime.now()
+                current_date = now.strftime("%Y-%m-%d")
                 
                 # Установим даты с разницей в 7 дней для удобства
-                start_date = (datetime.datetime.now() - datetime.timedelta(days=7)).strftime("%Y-%m-%d")
+                start_date = (now - datetime.timedelta(days=7)).strftime("%Y-%m-%d")
                 end_date = current_date
                 
                 # Устанавливаем даты
                 self.start_date_selector.set(start_date)
                 self.end_date_selector.set(end_date)
                 
-                # Update UI to ensure proper layout
-                self.custom_date_frame.update_idletasks()
                 logger.info(f"Custom date range shown with start={start_date}, end={end_date}")
             else:
                 # Hide custom date range
-                self.custom_date_frame.grid_remove()
+                if self.custom_date_frame is not None:
+                    self.custom_date_frame.grid_remove()
                 logger.info("Custom date range hidden")
         except Exception as e:
             logger.error(f"Error toggling custom date range: {e}")
@@ -775,37 +827,24 @@ class ReportsFrame(ctk.CTkFrame):
             Tuple of (start_date, end_date) as datetime objects
         """
         time_range = self.time_range_var.get()
-        now = datetime.datetime.now()
-        
-        if time_range == "Today":
-            # Today, midnight to now
-            start_date = datetime.datetime(now.year, now.month, now.day, 0, 0, 0)
-            end_date = now
-        elif time_range == "Yesterday":
-            # Yesterday, midnight to midnight
-            yesterday = now - datetime.timedelta(days=1)
-            start_date = datetime.datetime(yesterday.year, yesterday.month, yesterday.day, 0, 0, 0)
-            end_date = datetime.datetime(yesterday.year, yesterday.month, yesterday.day, 23, 59, 59)
-        elif time_range == "Last 7 days":
-            # Last 7 days
-            start_date = now - datetime.timedelta(days=7)
-            end_date = now
-        elif time_range == "Custom range":
+        dt = datetime.datetime
+        
+        if time_range == "Custom range":
             # Custom range
             start_year, start_month, start_day = self.start_date_selector.get_date()
             end_year, end_month, end_day = self.end_date_selector.get_date()
             
             try:
-                start_date = datetime.datetime(start_year, start_month, start_day, 0, 0, 0)
-                end_date = datetime.datetime(end_year, end_month, end_day, 23, 59, 59)
+                start_date = dt(start_year, start_month, start_day, 0, 0, 0)
+                end_date = dt(end_year, end_month, end_day, 23, 59, 59)
             except ValueError as e:
                 logger.error(f"Invalid date: {e}")
                 messagebox.showerror("Invalid Date", f"Please select a valid date range: {e}")
                 raise
         else:
-            # Default to today
-            start_date = datetime.datetime(now.year, now.month, now.day, 0, 0, 0)
-            end_date = now
+            # Preset ranges, default to today
+            handler = _RANGE_HANDLERS.get(time_range, _today_range)
+            start_date, end_date = handler(dt.now())
             
         return start_date, end_date
         
@@ -833,7 +872,7 @@ class ReportsFrame(ctk.CTkFrame):
             include_graphs = self.include_graphs_var.get()
             
             # Ask for destination directory
-            initial_dir = os.path.join(os.path.expanduser("~"), "dockify_reports")
+            initial_dir = self.reports_dir
             if not os.path.exists(initial_dir):
                 os.makedirs(initial_dir)
                 
@@ -864,21 +903,32 @@ class ReportsFrame(ctk.CTkFrame):
             if not dest_filepath.endswith(file_extension):
                 dest_filepath += file_extension
                 
+            # Snapshot the writer and the selection in display order with container display names;
+            # the job may start later, after the user has changed them
+            writer = self._writer
+            container_checkboxes = self.container_checkboxes
+            container_ids = [cid for cid in container_checkboxes if cid in self.selected_containers]
+            container_names = {
+                container_id: container_checkboxes[container_id]["display_name"]
+                for container_id in container_ids
+            }
+            
             # Show progress dialog
             progress_dialog = self.create_progress_dialog("Generating Report")
             
-            # Generate report in background thread
-            threading.Thread(
-                target=self.generate_report_thread,
-                args=(dest_filepath, report_format, include_graphs, start_date, end_date, progress_dialog),
-                daemon=True
-            ).start()
+            # Generate report on the report worker
+            self._report_executor.submit(
+                self.generate_report_thread,
+                dest_filepath, report_format, include_graphs, start_date, end_date, progress_dialog,
+                writer, container_ids, container_names
+            )
             
         except Exception as e:
             logger.error(f"Error preparing report generation: {e}")
             messagebox.showerror("Error", f"Error preparing report: {e}")
             
-    def generate_report_thread(self, dest_filepath, report_format, include_graphs, start_date, end_date, progress_dialog):
+    def generate_report_thread(self, dest_filepath, report_format, include_graphs, start_date, end_date, progress_dialog,
+                               writer, container_ids, container_names):
         """
         Generate report in a background thread.
         
@@ -889,60 +939,48 @@ class ReportsFrame(ctk.CTkFrame):
             start_date: Start date
             end_date: End date
             progress_dialog: Progress dialog window
+            writer: Export method bound to the report options when the report was requested
+            container_ids: Selected container IDs in display order
+            container_names: Container display names by ID
         """
         try:
             # Update progress
             self.after(0, lambda: progress_dialog.update_progress(10, "Collecting container data..."))
             
-            # Get container display names
-            container_names = {}
-            for container_id in self.selected_containers:
-                if container_id in self.container_checkboxes:
-                    container_names[container_id] = self.container_checkboxes[container_id]["display_name"]
-                    
             # Update progress
             self.after(0, lambda: progress_dialog.update_progress(30, "Processing metrics..."))
             
-            # Generate report
-            if report_format == "Excel":
-                success = self.exporter.export_to_excel(
-                    dest_filepath,
-                    self.selected_containers,
-                    container_names,
-                    start_date,
-                    end_date,
-                    include_graphs
-                )
-            else:
-                success = self.exporter.export_to_csv(
-                    dest_filepath,
-                    self.selected_containers,
-                    container_names,
-                    start_date,
-                    end_date
-                )
+            # Generate report with the writer bound to the selected options;
+            # huge reports are split into parts and packed into an archive
+            report_path = self.exporter.export_segmented(
+                writer,
+                dest_filepath,
+                container_ids,
+                container_names,
+                start_date,
+                end_date
+            )
+            success = bool(report_path)
                 
             # Update progress
             self.after(0, lambda: progress_dialog.update_progress(90, "Finalizing report..."))
             
-            time.sleep(0.5)  # Slight delay for UI
-            
-            # Close progress dialog
-            self.after(0, lambda: progress_dialog.destroy())
+            # Close progress dialog after a short pause on the Tk loop, the worker does not wait for it
+            self.after(500, progress_dialog.destroy)
             
             if success:
                 # Сохраняем отчет в базу данных, если есть сервис отчетов и ID пользователя
                 if self.report_service and self.user_id > 0:
                     try:
                         # Создаем запись в базе данных
-                        report_title = os.path.basename(dest_filepath)
+                        report_title = os.path.basename(report_path)
                         report_type = "excel" if report_format == "Excel" else "csv"
                         
                         # Параметры отчета
                         parameters = {
                             "containers": [
                                 {"id": container_id, "name": container_names.get(container_id, container_id)}
-                                for container_id in self.selected_containers
+                                for container_id in container_ids
                             ],
                             "include_graphs": include_graphs
                         }
@@ -952,10 +990,10 @@ class ReportsFrame(ctk.CTkFrame):
                             user_id=self.user_id,
                             title=report_title,
                             report_type=report_type,
-                            file_path=dest_filepath,
+                            file_path=report_path,
                             start_date=start_date,
                             end_date=end_date,
-                            description=f"Report for {len(self.selected_containers)} containers",
+                            description=f"Report for {len(container_ids)} containers",
                             parameters=parameters
                         )
                         
@@ -965,10 +1003,10 @@ class ReportsFrame(ctk.CTkFrame):
                 
                 # Show success message
                 self.after(0, lambda: messagebox.showinfo("Report Generated", 
-                                                        f"Report successfully generated at:\n{dest_filepath}"))
+                                                        f"Report successfully generated at:\n{report_path}"))
                                                         
                 # Refresh report history
-                self.after(0, self.load_report_history_thread)
+                self.after(0, self.load_report_history)
             else:
                 self.after(0, lambda: messagebox.showerror("Error", 
                                                          "Failed to generate report. Check logs for details."))
@@ -995,7 +1033,203 @@ class ReportsFrame(ctk.CTkFrame):
         Метод для обратной совместимости.
         Теперь использует асинхронную загрузку через load_report_history_thread.
         """
-        threading.Thread(target=self.load_report_history_thread, daemon=True).start()
+        if self._history_future is not None:
+            self._history_future.cancel()
+        self._history_future = self._executor.submit(self.load_report_history_thread)
+        
+    def destroy(self):
+        """Stop background workers before destroying the frame."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._report_executor.shutdown(wait=False, cancel_futures=True)
+        super().destroy()
+
+
+class ContainerCheckList(ctk.CTkFrame):
+    """
+    Virtualized checkbox list drawn on a single canvas.
+    
+    Only the rows inside the scroll viewport are materialized as canvas items,
+    so updating the list costs O(visible rows) regardless of the container count.
+    The items are pooled and updated in place, so a redraw never shows an empty list.
+    """
+    ROW_HEIGHT = 28
+    BOX_SIZE = 18
+    
+    def __init__(self, parent, height=150, bg_color=None, command=None, is_selected=None,
+                 empty_text="No containers available"):
+        """
+        Initialize the container list.
+        
+        Args:
+            parent: Parent widget
+            height: Viewport height in pixels
+            bg_color: Canvas background color
+            command: Callback invoked with the container ID of a clicked row
+            is_selected: Callable returning whether a container ID is selected
+            empty_text: Message shown when the list has no rows
+        """
+        super().__init__(parent, fg_color="transparent")
+        
+        self.command = command
+        self.is_selected = is_selected or (lambda container_id: False)
+        self.empty_text = empty_text
+        self.bg_color = bg_color or SPOTIFY_COLORS["card_background"]
+        
+        # Rows as (container_id, display_name, is_running) tuples
+        self.rows = []
+        
+        # Pending after_idle redraw, so bursts of changes are laid out once
+        self._redraw_job = None
+        
+        # Pool of canvas items reused across redraws: one (background, box, check, label) per slot
+        self._slots = []
+        self._empty_item = None
+        
+        self.canvas = tk.Canvas(
+            self,
+            height=height,
+            bg=self.bg_color,
+            highlightthickness=0,
+            bd=0,
+            yscrollincrement=self.ROW_HEIGHT
+        )
+        self.scrollbar = ctk.CTkScrollbar(
+            self,
+            orientation="vertical",
+            command=self.canvas.yview
+        )
+        self.canvas.configure(yscrollcommand=self._on_yscroll)
+        
+        self.scrollbar.pack(side="right", fill="y")
+        self.canvas.pack(side="left", fill="both", expand=True)
+        
+        self.canvas.bind("<Configure>", self._on_configure)
+        self.canvas.bind("<Button-1>", self._on_click)
+        self.canvas.bind("<MouseWheel>", self._on_mousewheel)
+        self.canvas.bind("<Button-4>", lambda event: self.canvas.yview_scroll(-1, "units"))
+        self.canvas.bind("<Button-5>", lambda event: self.canvas.yview_scroll(1, "units"))
+        
+    def set_rows(self, rows):
+        """
+        Replace the list contents.
+        
+        Args:
+            rows: List of (container_id, display_name, is_running) tuples
+        """
+        self.rows = rows
+        self._update_scrollregion()
+        self.canvas.yview_moveto(0)
+        self.redraw()
+        
+    def redraw(self):
+        """Schedule a redraw of the visible rows on the next idle pass."""
+        if self._redraw_job is None:
+            self._redraw_job = self.after_idle(self._draw_visible_rows)
+            
+    def destroy(self):
+        """Cancel any pending redraw before destroying the widget."""
+        if self._redraw_job is not None:
+            self.after_cancel(self._redraw_job)
+            self._redraw_job = None
+        super().destroy()
+        
+    def _draw_visible_rows(self):
+        """Update the pooled row items to show the rows inside the visible viewport."""
+        self._redraw_job = None
+        width = self.canvas.winfo_width()
+        
+        # Empty state message
+        if self._empty_item is None:
+            self._empty_item = self.canvas.create_text(
+                0, self.ROW_HEIGHT,
+                text=self.empty_text,
+                font=("Helvetica", 12),
+                fill=SPOTIFY_COLORS["text_subtle"]
+            )
+        self.canvas.coords(self._empty_item, max(width, 1) / 2, self.ROW_HEIGHT)
+        self.canvas.itemconfigure(self._empty_item, state="hidden" if self.rows else "normal")
+        
+        first, last = self._visible_range()
+        visible_count = max(0, last - first)
+        
+        # Grow the pool when the viewport shows more rows than ever before
+        while len(self._slots) < visible_count:
+            self._create_slot()
+            
+        for slot_index, items in enumerate(self._slots):
+            if slot_index < visible_count:
+                self._fill_slot(items, first + slot_index, width)
+            else:
+                for item in items:
+                    self.canvas.itemconfigure(item, state="hidden")
+                    
+    def _create_slot(self):
+        """Create the canvas items for one more visible row slot."""
+        background = self.canvas.create_rectangle(0, 0, 0, 0, fill=self.bg_color, outline="")
+        box = self.canvas.create_rectangle(0, 0, 0, 0, outline=SPOTIFY_COLORS["accent"], width=2)
+        check = self.canvas.create_text(
+            0, 0, text="✓", font=("Helvetica", 11, "bold"),
+            fill=SPOTIFY_COLORS["text_bright"]
+        )
+        label = self.canvas.create_text(0, 0, anchor="w", font=("Helvetica", 12))
+        self._slots.append((background, box, check, label))
+        
+    def _fill_slot(self, items, row_index, width):
+        """Move a pooled slot to the given row and update its contents in place."""
+        container_id, display_name, is_running = self.rows[row_index]
+        background, box, check, label = items
+        top = row_index * self.ROW_HEIGHT
+        middle = top + self.ROW_HEIGHT / 2
+        box_top = middle - self.BOX_SIZE / 2
+        selected = self.is_selected(container_id)
+        
+        self.canvas.coords(background, 0, top, width, top + self.ROW_HEIGHT)
+        self.canvas.coords(box, 5, box_top, 5 + self.BOX_SIZE, box_top + self.BOX_SIZE)
+        self.canvas.coords(check, 5 + self.BOX_SIZE / 2, middle)
+        self.canvas.coords(label, 5 + self.BOX_SIZE + 10, middle)
+        
+        self.canvas.itemconfigure(background, state="normal")
+        self.canvas.itemconfigure(
+            box, state="normal",
+            fill=SPOTIFY_COLORS["accent"] if selected else self.bg_color
+        )
+        self.canvas.itemconfigure(check, state="normal" if selected else "hidden")
+        self.canvas.itemconfigure(
+            label, state="normal", text=display_name,
+            fill=SPOTIFY_COLORS["text_bright"] if is_running else SPOTIFY_COLORS["text_subtle"]
+        )
+        
+    def _visible_range(self):
+        """Return the (first, last) row indexes intersecting the viewport."""
+        first = max(0, int(self.canvas.canvasy(0) // self.ROW_HEIGHT))
+        visible_count = self.canvas.winfo_height() // self.ROW_HEIGHT + 2
+        return first, min(len(self.rows), first + visible_count)
+        
+    def _on_click(self, event):
+        """Map a click anywhere on the canvas to its row and forward it to the toggle callback."""
+        row_index = int(self.canvas.canvasy(event.y) // self.ROW_HEIGHT)
+        if 0 <= row_index < len(self.rows) and self.command:
+            self.command(self.rows[row_index][0])
+            
+    def _update_scrollregion(self):
+        """Resize the scroll region to fit all rows."""
+        self.canvas.configure(
+            scrollregion=(0, 0, self.canvas.winfo_width(), len(self.rows) * self.ROW_HEIGHT)
+        )
+        
+    def _on_yscroll(self, first, last):
+        """Sync the scrollbar and draw the rows that scrolled into view."""
+        self.scrollbar.set(first, last)
+        self.redraw()
+        
+    def _on_configure(self, event=None):
+        """Handle canvas resize."""
+        self._update_scrollregion()
+        self.redraw()
+        
+    def _on_mousewheel(self, event):
+        """Scroll the list with the mouse wheel."""
+        self.canvas.yview_scroll(-1 if event.delta > 0 else 1, "units")
 
 
 class ReportHistoryItem(ctk.CTkFrame):
@@ -1014,7 +1248,7 @@ class ReportHistoryItem(ctk.CTkFrame):
         """
         super().__init__(
             parent,
-            fg_color=scale_color(SPOTIFY_COLORS["card_background"], 1.1),
+            fg_color=_CARD_SCALED,
             corner_radius=5,
             height=50
         )
@@ -1050,7 +1284,7 @@ class ReportHistoryItem(ctk.CTkFrame):
             text="Open",
             font=("Helvetica", 11),
             fg_color=SPOTIFY_COLORS["accent_blue"],
-            hover_color=lighten_color(SPOTIFY_COLORS["accent_blue"], 0.1),
+            hover_color=_BLUE_HOVER,
             text_color=SPOTIFY_COLORS["text_bright"],
             width=60,
             height=25,
@@ -1058,20 +1292,23 @@ class ReportHistoryItem(ctk.CTkFrame):
         )
         self.open_button.grid(row=0, column=1, rowspan=2, padx=10, pady=0)
         
+    def update_report(self, report_name, report_date, report_path):
+        """
+        Update the item in place to display another report.
+        
+        Args:
+            report_name: Report file name
+            report_date: Report generation date
+            report_path: Report file path
+        """
+        self.report_path = report_path
+        self.name_label.configure(text=report_name)
+        self.date_label.configure(text=f"Generated: {report_date.strftime('%Y-%m-%d %H:%M:%S')}")
+        
     def open_report(self):
         """Open the report file."""
         try:
-            # Use platform-specific command to open the file
-            import platform
-            import subprocess
-            
-            if platform.system() == 'Windows':
-                os.startfile(self.report_path)
-            elif platform.system() == 'Darwin':  # macOS
-                subprocess.call(('open', self.report_path))
-            else:  # Linux
-                subprocess.call(('xdg-open', self.report_path))
-                
+            _OPEN_FILE(self.report_path)
         except Exception as e:
             logger.error(f"Error opening report: {e}")
             messagebox.showerror("Error", f"Error opening report: {e}")
@@ -1093,7 +1330,13 @@ class ProgressDialog(ctk.CTkToplevel):
         """
         super().__init__(parent)
         self.title(title)
-        self.geometry(f"{width}x{height}")
+        
+        # Center on parent; its geometry is only flushed if it has not been laid out yet
+        if parent.winfo_width() <= 1:
+            parent.update_idletasks()
+        x = parent.winfo_rootx() + (parent.winfo_width() - width) // 2
+        y = parent.winfo_rooty() + (parent.winfo_height() - height) // 2
+        self.geometry(f"{width}x{height}+{x}+{y}")
         self.resizable(False, False)
         
         # Make modal
@@ -1127,24 +1370,12 @@ class ProgressDialog(ctk.CTkToplevel):
             width=300,
             height=15,
             corner_radius=2,
-            fg_color=scale_color(SPOTIFY_COLORS["card_background"], 1.2),
+            fg_color=_CARD_PROGRESS,
             progress_color=SPOTIFY_COLORS["accent_green"]
         )
         self.progress_bar.pack(pady=(0, 20))
         self.progress_bar.set(0)
         
-        # Center on parent
-        self.update_idletasks()
-        parent_x = parent.winfo_rootx()
-        parent_y = parent.winfo_rooty()
-        parent_width = parent.winfo_width()
-        parent_height = parent.winfo_height()
-        
-        x = parent_x + (parent_width - width) // 2
-        y = parent_y + (parent_height - height) // 2
-        
-        self.geometry(f"+{x}+{y}")
-        
     def update_progress(self, value, status=None):
         """
         Update progress and status message.
@@ -9,6 +9,16 @@ CONFIG_PATH = os.path.join(os.path.expanduser("~"), ".reimdockify", "config.json
 
 logger = logging.getLogger('reimdockify.ui.settings')
 
+DEFAULT_SETTINGS = {
+    'poll_interval': 5,
+    'docker_socket': '/var/run/docker.sock',
+    'enable_alerts': True,
+    'auto_adjust_interval': True
+}
+
+# Parsed config file, reused while its mtime is unchanged
+_cfg_cache = {'mtime': None, 'data': None}
+
 class SettingsDialog(tk.Toplevel):
     def __init__(self, parent, apply_callback):
         super().__init__(parent)
@@ -64,37 +74,32 @@ class SettingsDialog(tk.Toplevel):
             # Make sure the directory exists
             os.makedirs(os.path.dirname(CONFIG_PATH), exist_ok=True)
             
-            if os.path.exists(CONFIG_PATH):
+            try:
+                mtime = os.stat(CONFIG_PATH).st_mtime
+            except FileNotFoundError:
+                mtime = None
+                
+            if mtime is None:
+                self.cfg = dict(DEFAULT_SETTINGS)
+                logger.info("Using default settings")
+            elif mtime == _cfg_cache['mtime']:
+                # File unchanged since the last read
+                self.cfg = dict(_cfg_cache['data'])
+            else:
                 with open(CONFIG_PATH, 'r') as f:
                     self.cfg = json.load(f)
                     logger.info(f"Loaded settings from {CONFIG_PATH}")
-            else:
-                self.cfg = {
-                    'poll_interval': 5, 
-                    'docker_socket': '/var/run/docker.sock', 
-                    'enable_alerts': True,
-                    'auto_adjust_interval': True
-                }
-                logger.info("Using default settings")
-                
-            # Check for all required settings
-            if 'poll_interval' not in self.cfg:
-                self.cfg['poll_interval'] = 5
-            if 'docker_socket' not in self.cfg:
-                self.cfg['docker_socket'] = '/var/run/docker.sock'
-            if 'enable_alerts' not in self.cfg:
-                self.cfg['enable_alerts'] = True
-            if 'auto_adjust_interval' not in self.cfg:
-                self.cfg['auto_adjust_interval'] = True
+                    
+                # Check for all required settings
+                for key, value in DEFAULT_SETTINGS.items():
+                    self.cfg.setdefault(key, value)
+                    
+                _cfg_cache['mtime'] = mtime
+                _cfg_cache['data'] = dict(self.cfg)
                 
         except Exception as e:
             logger.error(f"Error loading settings: {e}")
-            self.cfg = {
-                'poll_interval': 5, 
-                'docker_socket': '/var/run/docker.sock', 
-                'enable_alerts': True,
-                'auto_adjust_interval': True
-            }
+            self.cfg = dict(DEFAULT_SETTINGS)
 
     def on_save(self):
         """Save settings and apply them."""
@@ -122,10 +127,15 @@ class SettingsDialog(tk.Toplevel):
                 'auto_adjust_interval': auto_adjust_interval
             }
             
-            # Save to file
+            # Save to file: write a temporary file and swap it in, so a failed write never leaves a partial config
             os.makedirs(os.path.dirname(CONFIG_PATH), exist_ok=True)
-            with open(CONFIG_PATH, 'w') as f:
+            tmp_path = CONFIG_PATH + '.tmp'
+            with open(tmp_path, 'w') as f:
                 json.dump(self.cfg, f, indent=2)
+            os.replace(tmp_path, CONFIG_PATH)
+            
+            _cfg_cache['mtime'] = os.stat(CONFIG_PATH).st_mtime
+            _cfg_cache['data'] = dict(self.cfg)
             
             logger.info(f"Saved settings to {CONFIG_PATH}: {self.cfg}")
             
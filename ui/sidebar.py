@@ -8,7 +8,7 @@ from typing import Dict, List, Any, Optional, Callable
 import customtkinter as ctk
 
 from utils.theme import SPOTIFY_COLORS, lighten_color, scale_color
-from assets.icons import get_icon_image
+from assets.icons import get_icon_image, preload_icons
 
 logger = logging.getLogger('reimdockify.ui.sidebar')
 
@@ -55,6 +55,18 @@ class SidebarFrame(ctk.CTkFrame):
         self.nav_frame = ctk.CTkFrame(self, fg_color="transparent")
         self.nav_frame.pack(fill="x", padx=10, pady=(20, 0))
         
+        # Render all sidebar icons up front, the buttons below then take them from the cache
+        nav_color = SPOTIFY_COLORS["text_standard"]
+        preload_icons((
+            ("overview", 20, nav_color),
+            ("containers", 20, nav_color),
+            ("metrics", 20, nav_color),
+            ("reports", 20, nav_color),
+            ("code", 20, nav_color),
+            ("settings", 16, SPOTIFY_COLORS["text_subtle"]),
+            ("log-out", 16, SPOTIFY_COLORS["accent_red"])
+        ))
+        
         # Navigation buttons
         self.btn_overview = self.create_nav_button("Overview", "overview")
         self.btn_containers = self.create_nav_button("Containers", "containers")
@@ -3,12 +3,58 @@ Configuration management for Dockify.
 Handles loading, saving, and accessing application configuration settings.
 """
 import os
-import json
+import copy
+import atexit
 import logging
-from typing import Dict, Any, Optional
+import threading
+import weakref
+from collections import deque
+from typing import Dict, Any, Optional, Tuple
 
 logger = logging.getLogger('dockify.utils.config')
 
+# Home directory is resolved once at import, not per AppConfig instance
+_HOME = os.path.expanduser("~")
+_DEFAULT_CONFIG = os.path.join(_HOME, ".dockify", "config.json")
+_DEFAULT_REPORTS = os.path.join(_HOME, "dockify_reports")
+
+# Length limit of the recent containers/reports lists
+RECENT_LIMIT = 10
+
+# Keys holding recent lists, kept in memory as bounded deques
+_RECENT_KEYS = ("recent_containers", "recent_reports")
+
+# Delay before pending changes are written to disk; bursts of changes within it are saved once
+SAVE_DELAY = 2.0
+
+# orjson parses and serializes noticeably faster, but it is an optional dependency
+try:
+    import orjson
+    
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data)
+        
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        
+except ImportError:
+    import json
+    
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
+        
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode('utf-8')
+
+# Live AppConfig instances; weak, so the exit hook does not keep them alive
+_INSTANCES = weakref.WeakSet()
+
+@atexit.register
+def _flush_all() -> None:
+    """Save pending changes of every live configuration at interpreter exit."""
+    for config in list(_INSTANCES):
+        config.flush()
+
 class AppConfig:
     """
     Manages application configuration settings.
@@ -21,14 +67,7 @@ class AppConfig:
             config_path: Path to configuration file (optional)
         """
         # Default configuration path in user's home directory
-        if config_path is None:
-            self.config_path = os.path.join(
-                os.path.expanduser("~"),
-                ".dockify",
-                "config.json"
-            )
-        else:
-            self.config_path = config_path
+        self.config_path = _DEFAULT_CONFIG if config_path is None else config_path
             
         # Default configuration
         self.defaults = {
@@ -45,16 +84,40 @@ class AppConfig:
             },
             "recent_containers": [],  # List of recently accessed containers
             "recent_reports": [],     # List of recently generated reports
-            "reports_dir": os.path.join(os.path.expanduser("~"), "dockify_reports"),
+            "reports_dir": _DEFAULT_REPORTS,
             "show_notifications": True
         }
         
-        # Current configuration (will be updated from file)
-        self.config = self.defaults.copy()
+        # Current configuration (will be updated from file); a deep copy,
+        # so editing nested settings never changes the defaults
+        self.config = copy.deepcopy(self.defaults)
+        
+        # The file is read on first access to the settings, not when the object is created
+        self._loaded = False
+        
+        # Resolved alert thresholds: (container_id, metric) -> threshold.
+        # The generation changes on every invalidation, so a lookup that raced
+        # with a change never stores the value it resolved before the change
+        self._threshold_cache: Dict[Tuple[Optional[str], str], float] = {}
+        self._threshold_generation = 0
+        self._threshold_lock = threading.Lock()
         
-        # Load configuration
-        self.load()
+        # Unsaved changes and the pending delayed save. The lock also guards every change
+        # to self.config, so the save timer thread never serializes a dict being modified
+        self._dirty = False
+        self._save_timer: Optional[threading.Timer] = None
+        self._save_lock = threading.RLock()
+        _INSTANCES.add(self)
         
+    def _ensure_loaded(self) -> None:
+        """Load configuration from file on first access."""
+        if not self._loaded:
+            # Flag is set first: load() may call save() to create the default file
+            self._loaded = True
+            self.load()
+            # Recent lists are bounded whether the file was parsed, created or unreadable
+            self._bound_recent_lists()
+            
     def load(self) -> bool:
         """
         Load configuration from file.
@@ -74,12 +137,15 @@ class AppConfig:
                 return True
                 
             # Load configuration from file
-            with open(self.config_path, 'r') as f:
-                loaded_config = json.load(f)
+            with open(self.config_path, 'rb') as f:
+                loaded_config = _loads(f.read())
                 
             # Update configuration with loaded values
-            for key, value in loaded_config.items():
-                self.config[key] = value
+            with self._save_lock:
+                for key, value in loaded_config.items():
+                    self.config[key] = value
+                self._bound_recent_lists()
+            self._invalidate_thresholds()
                 
             logger.info(f"Loaded configuration from {self.config_path}")
             return True
@@ -95,21 +161,67 @@ class AppConfig:
         Returns:
             True if configuration was saved successfully, False otherwise
         """
+        # Never overwrite the file with defaults that were not merged with it
+        self._ensure_loaded()
+        
         try:
+            # Serialize a snapshot while no other thread can change the settings,
+            # recent deques are written as plain JSON lists
+            with self._save_lock:
+                if self._save_timer is not None:
+                    self._save_timer.cancel()
+                    self._save_timer = None
+                self._dirty = False
+                data = _dumps({
+                    key: list(value) if isinstance(value, deque) else value
+                    for key, value in self.config.items()
+                })
+                
             # Create directory if it doesn't exist
             os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
             
-            # Save configuration to file
-            with open(self.config_path, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            # Save configuration to a temporary file and swap it in atomically
+            tmp_path = self.config_path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, self.config_path)
                 
             logger.info(f"Saved configuration to {self.config_path}")
             return True
             
         except Exception as e:
             logger.error(f"Error saving configuration: {e}")
+            # Changes are still unsaved: keep them for the next save or the exit flush
+            with self._save_lock:
+                self._dirty = True
             return False
             
+    def _bound_recent_lists(self) -> None:
+        """Replace the recent lists with deques capped at RECENT_LIMIT entries."""
+        for key in _RECENT_KEYS:
+            self.config[key] = deque(self.config.get(key) or (), maxlen=RECENT_LIMIT)
+            
+    def _invalidate_thresholds(self) -> None:
+        """Drop resolved thresholds after the threshold settings changed."""
+        with self._threshold_lock:
+            self._threshold_generation += 1
+            self._threshold_cache.clear()
+            
+    def flush(self) -> None:
+        """Save pending changes immediately, if there are any."""
+        if self._dirty:
+            self.save()
+            
+    def _mark_dirty(self) -> None:
+        """Schedule a delayed save, restarting the delay if one is already pending."""
+        with self._save_lock:
+            self._dirty = True
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(SAVE_DELAY, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+            
     def get(self, key: str, default: Any = None) -> Any:
         """
         Get a configuration value.
@@ -121,7 +233,12 @@ class AppConfig:
         Returns:
             Configuration value or default
         """
-        return self.config.get(key, default)
+        self._ensure_loaded()
+        value = self.config.get(key, default)
+        # Recent deques are an internal detail, callers get lists
+        if key in _RECENT_KEYS and isinstance(value, deque):
+            return list(value)
+        return value
         
     def set(self, key: str, value: Any) -> None:
         """
@@ -131,7 +248,12 @@ class AppConfig:
             key: Configuration key
             value: Configuration value
         """
-        self.config[key] = value
+        self._ensure_loaded()
+        with self._save_lock:
+            self.config[key] = value
+            self._mark_dirty()
+        # Key may replace a whole thresholds dict
+        self._invalidate_thresholds()
         
     def get_alert_threshold(self, metric: str, container_id: Optional[str] = None) -> float:
         """
@@ -144,14 +266,32 @@ class AppConfig:
         Returns:
             Threshold value
         """
+        self._ensure_loaded()
+        
+        # Hot path: after the first lookup a threshold is a single dict lookup
+        cache_key = (container_id, metric)
+        threshold = self._threshold_cache.get(cache_key)
+        if threshold is not None:
+            return threshold
+            
+        generation = self._threshold_generation
+        
         # Check for container-specific threshold
+        threshold = None
         if container_id is not None:
             container_thresholds = self.config.get('container_alert_thresholds', {})
             if container_id in container_thresholds and metric in container_thresholds[container_id]:
-                return container_thresholds[container_id][metric]
+                threshold = container_thresholds[container_id][metric]
                 
         # Fall back to default threshold
-        return self.config.get('alert_thresholds', {}).get(metric, self.defaults['alert_thresholds'].get(metric, 80.0))
+        if threshold is None:
+            threshold = self.config.get('alert_thresholds', {}).get(metric, self.defaults['alert_thresholds'].get(metric, 80.0))
+            
+        # Settings changed while resolving: the value may be stale, return it without caching
+        with self._threshold_lock:
+            if generation == self._threshold_generation:
+                self._threshold_cache[cache_key] = threshold
+        return threshold
         
     def set_alert_threshold(self, metric: str, value: float, container_id: Optional[str] = None) -> None:
         """
@@ -162,21 +302,28 @@ class AppConfig:
             value: Threshold value
             container_id: Container ID (optional)
         """
-        if container_id is not None:
-            # Set container-specific threshold
-            if 'container_alert_thresholds' not in self.config:
-                self.config['container_alert_thresholds'] = {}
-                
-            if container_id not in self.config['container_alert_thresholds']:
-                self.config['container_alert_thresholds'][container_id] = {}
-                
-            self.config['container_alert_thresholds'][container_id][metric] = value
-        else:
-            # Set default threshold
-            if 'alert_thresholds' not in self.config:
-                self.config['alert_thresholds'] = {}
+        self._ensure_loaded()
+        
+        with self._save_lock:
+            if container_id is not None:
+                # Set container-specific threshold
+                if 'container_alert_thresholds' not in self.config:
+                    self.config['container_alert_thresholds'] = {}
+                    
+                if container_id not in self.config['container_alert_thresholds']:
+                    self.config['container_alert_thresholds'][container_id] = {}
+                    
+                self.config['container_alert_thresholds'][container_id][metric] = value
+            else:
+                # Set default threshold
+                if 'alert_thresholds' not in self.config:
+                    self.config['alert_thresholds'] = {}
+                    
+                self.config['alert_thresholds'][metric] = value
                 
-            self.config['alert_thresholds'][metric] = value
+            self._mark_dirty()
+            
+        self._invalidate_thresholds()
             
     def add_recent_container(self, container_id: str, container_name: str) -> None:
         """
@@ -186,20 +333,23 @@ class AppConfig:
             container_id: Container ID
             container_name: Container name
         """
-        # Get recent containers list
-        recent_containers = self.config.get('recent_containers', [])
-        
-        # Remove if already in list
-        recent_containers = [c for c in recent_containers if c['id'] != container_id]
+        self._ensure_loaded()
         
-        # Add to beginning of list
-        recent_containers.insert(0, {
-            'id': container_id,
-            'name': container_name
-        })
-        
-        # Limit to 10 recent containers
-        self.config['recent_containers'] = recent_containers[:10]
+        with self._save_lock:
+            # Remove if already in list
+            recent_containers = deque(
+                (c for c in self.config.get('recent_containers', ()) if c['id'] != container_id),
+                maxlen=RECENT_LIMIT
+            )
+            
+            # Add to beginning of list, the deque drops the oldest entry past RECENT_LIMIT
+            recent_containers.appendleft({
+                'id': container_id,
+                'name': container_name
+            })
+            
+            self.config['recent_containers'] = recent_containers
+            self._mark_dirty()
         
     def add_recent_report(self, report_path: str) -> None:
         """
@@ -208,18 +358,25 @@ class AppConfig:
         Args:
             report_path: Path to report file
         """
-        # Get recent reports list
-        recent_reports = self.config.get('recent_reports', [])
-        
-        # Remove if already in list
-        recent_reports = [r for r in recent_reports if r != report_path]
+        self._ensure_loaded()
         
-        # Add to beginning of list
-        recent_reports.insert(0, report_path)
-        
-        # Limit to 10 recent reports
-        self.config['recent_reports'] = recent_reports[:10]
+        with self._save_lock:
+            # Remove if already in list
+            recent_reports = deque(
+                (r for r in self.config.get('recent_reports', ()) if r != report_path),
+                maxlen=RECENT_LIMIT
+            )
+            
+            # Add to beginning of list, the deque drops the oldest entry past RECENT_LIMIT
+            recent_reports.appendleft(report_path)
+            
+            self.config['recent_reports'] = recent_reports
+            self._mark_dirty()
         
     def reset_to_defaults(self) -> None:
         """Reset configuration to default values."""
-        self.config = self.defaults.copy()
+        with self._save_lock:
+            self.config = copy.deepcopy(self.defaults)
+            self._bound_recent_lists()
+        self._invalidate_thresholds()
+        self._loaded = True
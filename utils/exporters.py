@@ -6,14 +6,208 @@ import os
 import logging
 import csv
 import datetime
-from typing import Dict, List, Any, Optional, Tuple
+import math
+from typing import Callable, Dict, Iterable, Iterator, List, Any, Optional, Set, Tuple
 import time
-from tkinter import messagebox
+import threading
+import zipfile
+import io
+from xml.sax.saxutils import escape, quoteattr
+import shutil
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 
 from core.monitor import ContainerMonitor
 
 logger = logging.getLogger('dockify.utils.exporters')
 
+# CSV export: write buffer size
+CSV_BUFFER_SIZE = 1 << 20
+
+# Reports with more rows than this are split into several files
+SEGMENT_SIZE = 250000
+SEGMENT_WORKERS = 4
+
+# Threads preparing per-container sheet data in export_to_excel; parts of a segmented
+# report already run concurrently, so each part prepares its data on its own thread
+EXPORT_WORKERS = 8
+
+# Generated reports are reused for identical requests within this many seconds
+RESULT_CACHE_TTL = 600.0
+RESULT_CACHE_SIZE = 16
+
+# Summary aggregates are cached per container in buckets of this many seconds
+AGGREGATE_RESOLUTION = 300
+AGGREGATE_CACHE_SIZE = 4096
+
+# Container history columns are reused for this many seconds (shorter than a monitor refresh)
+HISTORY_CACHE_TTL = 2.0
+HISTORY_CACHE_SIZE = 64
+
+# Column headers of the exported files
+CONTAINER_SHEET_HEADER = (
+    'Timestamp',
+    'CPU (%)',
+    'Memory (%)',
+    'Memory Usage (MB)',
+    'Network RX (KB)',
+    'Network TX (KB)'
+)
+CSV_HEADER = (
+    'Container ID',
+    'Container Name',
+    'Timestamp',
+    'CPU (%)',
+    'Memory (%)',
+    'Memory Usage (MB)',
+    'Network RX (KB)',
+    'Network TX (KB)'
+)
+SUMMARY_SHEET_HEADER = (
+    'Container ID',
+    'Container Name',
+    'Avg CPU (%)',
+    'Max CPU (%)',
+    'Avg Memory (%)',
+    'Max Memory (%)',
+    'Data Points'
+)
+
+# Minimal OOXML package parts for the raw xlsx writer
+_XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+_SPREADSHEETML_NS = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+_RELATIONSHIP_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+_XLSX_CONTENT_TYPES = (
+    _XML_DECLARATION +
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '<Override PartName="/xl/sharedStrings.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/>'
+    '{sheets}</Types>'
+)
+_XLSX_ROOT_RELS = (
+    _XML_DECLARATION +
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    f'<Relationship Id="rId1" Type="{_RELATIONSHIP_NS}/officeDocument" Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+_XLSX_WORKBOOK = (
+    _XML_DECLARATION +
+    f'<workbook xmlns="{_SPREADSHEETML_NS}" xmlns:r="{_RELATIONSHIP_NS}">'
+    '<sheets>{sheets}</sheets></workbook>'
+)
+_XLSX_WORKBOOK_RELS = (
+    _XML_DECLARATION +
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">{sheets}'
+    f'<Relationship Id="rId{{styles_id}}" Type="{_RELATIONSHIP_NS}/styles" Target="styles.xml"/>'
+    f'<Relationship Id="rId{{strings_id}}" Type="{_RELATIONSHIP_NS}/sharedStrings" Target="sharedStrings.xml"/>'
+    '</Relationships>'
+)
+# Cell styles: 0 - default, 1 - datetime, 2 - "0.00" number, 3 - bold header
+_XLSX_STYLES = (
+    _XML_DECLARATION +
+    f'<styleSheet xmlns="{_SPREADSHEETML_NS}">'
+    '<numFmts count="1"><numFmt numFmtId="164" formatCode="yyyy-mm-dd hh:mm:ss"/></numFmts>'
+    '<fonts count="2"><font><sz val="11"/><name val="Calibri"/></font>'
+    '<font><b/><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="4">'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="164" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+    '<xf numFmtId="2" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+    '<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1"/>'
+    '</cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>'
+)
+_XLSX_SHEET_START = (_XML_DECLARATION + f'<worksheet xmlns="{_SPREADSHEETML_NS}"><sheetData>').encode('utf-8')
+_XLSX_SHEET_END = b'</sheetData></worksheet>'
+_XLSX_STYLE_DEFAULT = 0
+_XLSX_STYLE_DATETIME = 1
+_XLSX_STYLE_NUMBER = 2
+_XLSX_STYLE_HEADER = 3
+
+# Characters Excel forbids in sheet names, replaced in a single translate() pass
+_SHEET_XLATE = str.maketrans(dict.fromkeys('/\\?*[]:', '_'))
+
+# Excel limits sheet names to this many characters
+SHEET_NAME_LIMIT = 31
+
+# Sheets added after the container sheets; container sheets must not take these names
+_RESERVED_SHEET_NAMES = ('Summary', 'Info')
+
+# Byte unit divisors for the exported MB/KB columns
+_MB = float(1 << 20)
+_KB = float(1 << 10)
+
+# Excel serial dates count days from this moment
+_EXCEL_EPOCH = datetime.datetime(1899, 12, 30)
+
+def _display_names(container_ids: List[str], container_names: Dict[str, str]) -> Dict[str, str]:
+    """Map container IDs to their display names, falling back to the short ID."""
+    names_get = container_names.get
+    return {container_id: names_get(container_id) or container_id[:12] for container_id in container_ids}
+
+def _ensure_dir(directory: str) -> None:
+    """Create the directory if needed; an existing directory costs a single stat call."""
+    if not os.path.isdir(directory):
+        os.makedirs(directory, exist_ok=True)
+
+def _unique_sheet_name(name: str, used: Set[str]) -> str:
+    """
+    Make a valid sheet name that differs from every name already in the workbook.
+    
+    Excel compares sheet names case-insensitively, so names that collide after
+    truncation get a "~2", "~3", ... suffix.
+    
+    Args:
+        name: Desired sheet name
+        used: Case-folded names already taken; the returned name is added to it
+        
+    Returns:
+        Sheet name of at most SHEET_NAME_LIMIT characters
+    """
+    base = name.translate(_SHEET_XLATE)
+    sheet_name = base[:SHEET_NAME_LIMIT]
+    number = 1
+    while sheet_name.casefold() in used:
+        number += 1
+        suffix = f'~{number}'
+        sheet_name = base[:SHEET_NAME_LIMIT - len(suffix)] + suffix
+    used.add(sheet_name.casefold())
+    return sheet_name
+
+def _converted_columns(columns: Dict[str, np.ndarray]) -> Tuple[List[float], ...]:
+    """
+    Round and unit-convert metric columns for export.
+    
+    Args:
+        columns: Metric columns of a container (see ContainerMonitor.get_metrics_history_columns)
+        
+    Returns:
+        (timestamp, cpu, memory, memory_mb, network_rx_kb, network_tx_kb) lists
+    """
+    return (
+        columns['timestamp'].tolist(),
+        np.round(columns['cpu_percent'], 2).tolist(),
+        np.round(columns['memory_percent'], 2).tolist(),
+        # Convert memory to MB
+        np.round(columns['memory_usage'] / _MB, 2).tolist(),
+        # Convert network to KB
+        np.round(columns['network_rx'] / _KB, 2).tolist(),
+        np.round(columns['network_tx'] / _KB, 2).tolist()
+    )
+
 class MetricsExporter:
     """
     Exports container metrics to various formats.
@@ -27,6 +221,22 @@ class MetricsExporter:
         """
         self.container_monitor = container_monitor
         
+        # Recently generated reports: request key -> (monotonic creation time, report path)
+        self._result_cache = OrderedDict()
+        
+        # Bucket aggregates: (container_id, resolution, bucket_start) ->
+        # (count, first_timestamp, last_timestamp, cpu_sum, cpu_max, memory_sum, memory_max)
+        self._aggregate_cache = OrderedDict()
+        # Segmented reports summarize their parts concurrently
+        self._aggregate_lock = threading.Lock()
+        
+        # History columns: container_id -> (monotonic fetch time, columns); filled from worker threads
+        self._history_cache = OrderedDict()
+        self._history_lock = threading.Lock()
+        
+        # Marks the threads writing a part of a segmented report
+        self._part_context = threading.local()
+        
     def export_to_excel(self, 
                       filepath: str, 
                       container_ids: List[str], 
@@ -49,176 +259,125 @@ class MetricsExporter:
             True if successful, False otherwise
         """
         try:
-            # Check for pandas and xlsxwriter
-            import pandas as pd
-            import plotly.express as px
-            import plotly.graph_objects as go
-            from plotly.subplots import make_subplots
+            # Check for xlsxwriter
+            import xlsxwriter
             
             # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(os.path.abspath(filepath)), exist_ok=True)
+            _ensure_dir(os.path.dirname(os.path.abspath(filepath)))
             
-            # Create Excel writer - явно указываем engine='xlsxwriter'
-            with pd.ExcelWriter(filepath, engine='xlsxwriter') as writer:
-                # Create summary sheet
-                summary_data = {
-                    'Container ID': [],
-                    'Container Name': [],
-                    'Avg CPU (%)': [],
-                    'Max CPU (%)': [],
-                    'Avg Memory (%)': [],
-                    'Max Memory (%)': [],
-                    'Data Points': []
-                }
+            # constant_memory: строки сбрасываются на диск по мере записи, память не растет с размером отчета
+            # nan_inf_to_errors: a NaN/inf sample becomes an error cell instead of failing the whole report
+            workbook = xlsxwriter.Workbook(filepath, {
+                'constant_memory': True,
+                'strings_to_numbers': False,
+                'nan_inf_to_errors': True
+            })
+            try:
+                # Cell formats are created once and shared by every sheet
+                header_format = workbook.add_format({'bold': True})
+                number_format = workbook.add_format({'num_format': '0.00'})
+                datetime_format = workbook.add_format({'num_format': 'yyyy-mm-dd hh:mm:ss'})
+                
+                # Summary rows, written after the container sheets
+                summary_rows = []
+                
+                # Контейнеры независимы: выборка и конвертация колонок идут параллельно,
+                # а листы пишутся последовательно, так как Workbook не потокобезопасен
+                start_timestamp = start_time.timestamp()
+                end_timestamp = end_time.timestamp()
+                prepare = lambda container_id: self._container_payload(container_id, start_timestamp, end_timestamp)
+                if getattr(self._part_context, 'active', False) or len(container_ids) < 2:
+                    payloads = [prepare(container_id) for container_id in container_ids]
+                else:
+                    workers = min(EXPORT_WORKERS, len(container_ids))
+                    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="export-payload") as executor:
+                        payloads = list(executor.map(prepare, container_ids))
+                fromtimestamp = datetime.datetime.fromtimestamp
+                display_names = _display_names(container_ids, container_names)
+                used_sheet_names = {name.casefold() for name in _RESERVED_SHEET_NAMES}
                 
                 # Process each container
-                for container_id in container_ids:
+                for container_id, (columns, converted_columns) in zip(container_ids, payloads):
                     # Get container name
-                    container_name = container_names.get(container_id, container_id[:12])
+                    container_name = display_names[container_id]
                     
-                    # Get metrics history
-                    metrics = self.container_monitor.get_metrics_history(container_id)
+                    row_count = len(columns['timestamp'])
                     
-                    # Filter metrics by time range
-                    start_timestamp = start_time.timestamp()
-                    end_timestamp = end_time.timestamp()
-                    
-                    filtered_metrics = [
-                        m for m in metrics 
-                        if start_timestamp <= m.get('timestamp', 0) <= end_timestamp
-                    ]
-                    
-                    if not filtered_metrics:
+                    if not row_count:
                         logger.warning(f"No metrics found for container {container_id} in the specified time range")
                         continue
                         
-                    # Calculate summary statistics
-                    cpu_values = [m.get('cpu_percent', 0) for m in filtered_metrics]
-                    memory_values = [m.get('memory_percent', 0) for m in filtered_metrics]
-                    
-                    avg_cpu = sum(cpu_values) / len(cpu_values) if cpu_values else 0
-                    max_cpu = max(cpu_values) if cpu_values else 0
-                    avg_memory = sum(memory_values) / len(memory_values) if memory_values else 0
-                    max_memory = max(memory_values) if memory_values else 0
-                    
                     # Add to summary data
-                    summary_data['Container ID'].append(container_id[:12])
-                    summary_data['Container Name'].append(container_name)
-                    summary_data['Avg CPU (%)'].append(round(avg_cpu, 2))
-                    summary_data['Max CPU (%)'].append(round(max_cpu, 2))
-                    summary_data['Avg Memory (%)'].append(round(avg_memory, 2))
-                    summary_data['Max Memory (%)'].append(round(max_memory, 2))
-                    summary_data['Data Points'].append(len(filtered_metrics))
+                    summary_rows.append(self._summary_row(container_id, container_name, columns))
                     
-                    # Create container-specific sheet
-                    container_data = {
-                        'Timestamp': [],
-                        'CPU (%)': [],
-                        'Memory (%)': [],
-                        'Memory Usage (MB)': [],
-                        'Network RX (KB)': [],
-                        'Network TX (KB)': []
-                    }
+                    # Create container-specific sheet, streamed row by row
+                    safe_sheet_name = _unique_sheet_name(container_name, used_sheet_names)
+                    worksheet = workbook.add_worksheet(safe_sheet_name)
+                    worksheet.write_row(0, 0, CONTAINER_SHEET_HEADER, header_format)
                     
-                    for metric in filtered_metrics:
-                        timestamp = datetime.datetime.fromtimestamp(metric.get('timestamp', 0))
-                        container_data['Timestamp'].append(timestamp)
-                        container_data['CPU (%)'].append(round(metric.get('cpu_percent', 0), 2))
-                        container_data['Memory (%)'].append(round(metric.get('memory_percent', 0), 2))
-                        
-                        # Convert memory to MB
-                        memory_mb = metric.get('memory_usage', 0) / (1024 * 1024)
-                        container_data['Memory Usage (MB)'].append(round(memory_mb, 2))
-                        
-                        # Convert network to KB
-                        network_rx_kb = metric.get('network_rx', 0) / 1024
-                        network_tx_kb = metric.get('network_tx', 0) / 1024
-                        container_data['Network RX (KB)'].append(round(network_rx_kb, 2))
-                        container_data['Network TX (KB)'].append(round(network_tx_kb, 2))
+                    # Колонки сконвертированы целиком заранее, тип каждой колонки известен
+                    rows = zip(*converted_columns)
                     
-                    # Create DataFrame and save to sheet
-                    container_df = pd.DataFrame(container_data)
-                    safe_sheet_name = container_name[:31].replace('/', '_').replace('\\', '_').replace('?', '_')
-                    container_df.to_excel(writer, sheet_name=safe_sheet_name, index=False)
+                    # Typed writers skip the per-cell type detection of write()/write_row()
+                    write_datetime = worksheet.write_datetime
+                    write_number = worksheet.write_number
                     
-                    # Generate and save charts if requested
-                    if include_graphs:
-                        # Initialize a workbook
-                        workbook = writer.book
-                        worksheet = writer.sheets[safe_sheet_name]
-                        
-                        # CPU and Memory chart
-                        fig = make_subplots(
-                            rows=2, cols=1,
-                            subplot_titles=("CPU Usage (%)", "Memory Usage (%)"),
-                            shared_xaxes=True,
-                            vertical_spacing=0.1
-                        )
-                        
-                        # Add CPU trace
-                        fig.add_trace(
-                            go.Scatter(
-                                x=container_data['Timestamp'],
-                                y=container_data['CPU (%)'],
-                                mode='lines',
-                                name='CPU Usage',
-                                line=dict(color='#1DB954', width=2)
-                            ),
-                            row=1, col=1
-                        )
-                        
-                        # Add Memory trace
-                        fig.add_trace(
-                            go.Scatter(
-                                x=container_data['Timestamp'],
-                                y=container_data['Memory (%)'],
-                                mode='lines',
-                                name='Memory Usage',
-                                line=dict(color='#9C27B0', width=2)
-                            ),
-                            row=2, col=1
-                        )
+                    for row, (timestamp, cpu, memory, memory_mb, network_rx_kb, network_tx_kb) in enumerate(rows, start=1):
+                        write_datetime(row, 0, fromtimestamp(timestamp), datetime_format)
+                        write_number(row, 1, cpu, number_format)
+                        write_number(row, 2, memory, number_format)
+                        write_number(row, 3, memory_mb, number_format)
+                        write_number(row, 4, network_rx_kb, number_format)
+                        write_number(row, 5, network_tx_kb, number_format)
                         
-                        # Update layout
-                        fig.update_layout(
-                            height=500,
-                            title_text=f"{container_name} - Performance Metrics",
-                            showlegend=True
-                        )
-                        
-                        # Save chart image
-                        chart_path = os.path.splitext(filepath)[0] + f"_{safe_sheet_name}_chart.png"
-                        fig.write_image(chart_path)
+                    # Native Excel chart referencing the sheet data instead of a rendered image
+                    if include_graphs:
+                        last_row = row_count
+                        chart = workbook.add_chart({'type': 'line'})
+                        for column, series_name, color in ((1, 'CPU Usage', '#1DB954'), (2, 'Memory Usage', '#9C27B0')):
+                            chart.add_series({
+                                'name': series_name,
+                                'categories': [safe_sheet_name, 1, 0, last_row, 0],
+                                'values': [safe_sheet_name, 1, column, last_row, column],
+                                'line': {'color': color, 'width': 2}
+                            })
+                        chart.set_title({'name': f"{container_name} - Performance Metrics"})
+                        chart.set_x_axis({'date_axis': True, 'num_format': 'hh:mm'})
+                        chart.set_y_axis({'name': 'Usage (%)'})
+                        chart.set_size({'width': 720, 'height': 500})
+                        worksheet.insert_chart('H2', chart)
                         
-                        # Add image to worksheet
-                        # Note: This part would typically use openpyxl's image insertion,
-                        # but we'll skip the actual insertion since it's complex and
-                        # requires additional libraries. In a real app, you would add
-                        # the image to the Excel file here.
-                    
                 # Create summary sheet
-                if summary_data['Container ID']:
-                    summary_df = pd.DataFrame(summary_data)
-                    summary_df.to_excel(writer, sheet_name='Summary', index=False)
-                    
+                if summary_rows:
+                    summary_sheet = workbook.add_worksheet('Summary')
+                    summary_sheet.write_row(0, 0, SUMMARY_SHEET_HEADER, header_format)
+                    for row, summary_row in enumerate(summary_rows, start=1):
+                        summary_sheet.write_row(row, 0, summary_row)
+                        
                     # Add report information
-                    info_df = pd.DataFrame({
-                        'Report Information': ['Generated At', 'Time Range', 'Containers', 'Generated By'],
-                        'Value': [
-                            datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                            f"{start_time.strftime('%Y-%m-%d %H:%M:%S')} to {end_time.strftime('%Y-%m-%d %H:%M:%S')}",
-                            len(container_ids),
-                            'Dockify'
-                        ]
-                    })
-                    info_df.to_excel(writer, sheet_name='Info', index=False)
-                    
+                    info_sheet = workbook.add_worksheet('Info')
+                    info_sheet.write_row(0, 0, ('Report Information', 'Value'), header_format)
+                    info_rows = self._info_rows(container_ids, start_time, end_time)
+                    for row, info_row in enumerate(info_rows, start=1):
+                        info_sheet.write_row(row, 0, info_row)
+            except Exception:
+                # A failed export must not leave a truncated report behind
+                try:
+                    workbook.close()
+                finally:
+                    if os.path.exists(filepath):
+                        os.remove(filepath)
+                raise
+                
+            workbook.close()
             return True
             
         except ImportError as e:
             logger.error(f"Required libraries not available for Excel export: {e}")
             # Уведомляем пользователя о проблеме и спрашиваем, хочет ли он сохранить в CSV
             logger.info("Falling back to CSV export due to missing Excel libraries")
+            # tkinter импортируется только здесь, чтобы экспорт работал и без GUI
+            from tkinter import messagebox
             messagebox_result = messagebox.askyesno(
                 "Excel Export Failed",
                 "Required libraries for Excel export are not available. Would you like to save as CSV instead?",
@@ -234,6 +393,205 @@ class MetricsExporter:
             logger.error(f"Error exporting to Excel: {e}")
             return False
             
+    def export_to_excel_raw(self,
+                            filepath: str,
+                            container_ids: List[str],
+                            container_names: Dict[str, str],
+                            start_time: datetime.datetime,
+                            end_time: datetime.datetime) -> bool:
+        """
+        Export metrics to Excel format without graphs by streaming the sheet XML directly.
+        
+        Produces the same sheets as export_to_excel, bypassing the workbook object model.
+        
+        Args:
+            filepath: Path to save the Excel file
+            container_ids: List of container IDs to include
+            container_names: Mapping of container IDs to display names
+            start_time: Start time for metrics
+            end_time: End time for metrics
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            # Metrics of all containers inside the time range, collected in one pass
+            metrics_by_container = self.fetch_all_metrics(container_ids, start_time, end_time)
+            
+            display_names = _display_names(container_ids, container_names)
+            used_sheet_names = {name.casefold() for name in _RESERVED_SHEET_NAMES}
+            
+            sheets = []
+            summary_rows = []
+            
+            # Process each container
+            for container_id in container_ids:
+                # Get container name
+                container_name = display_names[container_id]
+                
+                columns = metrics_by_container[container_id]
+                
+                if not len(columns['timestamp']):
+                    logger.warning(f"No metrics found for container {container_id} in the specified time range")
+                    continue
+                    
+                # Add to summary data
+                summary_rows.append(self._summary_row(container_id, container_name, columns))
+                
+                # Container rows are generated while the sheet is streamed
+                safe_sheet_name = _unique_sheet_name(container_name, used_sheet_names)
+                sheets.append((safe_sheet_name, CONTAINER_SHEET_HEADER, self._container_rows(columns)))
+                
+            # Create summary sheet
+            if summary_rows:
+                sheets.append(('Summary', SUMMARY_SHEET_HEADER, summary_rows))
+                sheets.append(('Info', ('Report Information', 'Value'), self._info_rows(container_ids, start_time, end_time)))
+                
+            # Create directory if it doesn't exist
+            _ensure_dir(os.path.dirname(os.path.abspath(filepath)))
+            
+            self._export_xlsx_raw(filepath, sheets)
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error exporting to Excel: {e}")
+            return False
+            
+    def _export_xlsx_raw(self, filepath: str, sheets: List[Tuple[str, Tuple[str, ...], Iterable[tuple]]]) -> None:
+        """
+        Write a minimal xlsx package with one worksheet per (name, columns, rows) entry.
+        
+        Strings go to a shared strings table, numbers are written inline, datetimes as
+        Excel serial dates. Rows are streamed, so they may come from a generator.
+        
+        Args:
+            filepath: Path to save the Excel file
+            sheets: (sheet_name, column_headers, row_iterable) tuples
+        """
+        # Workbook must contain at least one sheet
+        if not sheets:
+            sheets = [('Sheet1', (), ())]
+            
+        shared_strings: Dict[str, int] = {}
+        
+        def string_cell(value, style):
+            index = shared_strings.get(value)
+            if index is None:
+                index = shared_strings[value] = len(shared_strings)
+            return f'<c t="s" s="{style}"><v>{index}</v></c>'
+            
+        def cell(value):
+            if isinstance(value, str):
+                return string_cell(value, _XLSX_STYLE_DEFAULT)
+            if isinstance(value, datetime.datetime):
+                serial = (value - _EXCEL_EPOCH).total_seconds() / 86400
+                return f'<c s="{_XLSX_STYLE_DATETIME}"><v>{serial!r}</v></c>'
+            if isinstance(value, float):
+                # NaN/inf have no OOXML form: the cell is left blank, it still holds its column position
+                if not math.isfinite(value):
+                    return f'<c s="{_XLSX_STYLE_NUMBER}"/>'
+                return f'<c s="{_XLSX_STYLE_NUMBER}"><v>{value!r}</v></c>'
+            if isinstance(value, bool):
+                return f'<c t="b"><v>{int(value)}</v></c>'
+            return f'<c><v>{value}</v></c>'
+            
+        with zipfile.ZipFile(filepath, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as package:
+            for sheet_number, (sheet_name, columns, rows) in enumerate(sheets, start=1):
+                sheet_stream = package.open(f'xl/worksheets/sheet{sheet_number}.xml', 'w')
+                with io.BufferedWriter(sheet_stream, buffer_size=CSV_BUFFER_SIZE) as stream:
+                    stream.write(_XLSX_SHEET_START)
+                    row_number = 1
+                    if columns:
+                        header_cells = ''.join(string_cell(column, _XLSX_STYLE_HEADER) for column in columns)
+                        stream.write(f'<row r="1">{header_cells}</row>'.encode('utf-8'))
+                        row_number = 2
+                    for row in rows:
+                        cells = ''.join(cell(value) for value in row)
+                        stream.write(f'<row r="{row_number}">{cells}</row>'.encode('utf-8'))
+                        row_number += 1
+                    stream.write(_XLSX_SHEET_END)
+                    
+            # Shared strings are known only after all sheets are streamed
+            strings = ''.join(f'<si><t xml:space="preserve">{escape(value)}</t></si>' for value in shared_strings)
+            package.writestr(
+                'xl/sharedStrings.xml',
+                f'{_XML_DECLARATION}<sst xmlns="{_SPREADSHEETML_NS}" count="{len(shared_strings)}" '
+                f'uniqueCount="{len(shared_strings)}">{strings}</sst>'
+            )
+            
+            sheet_count = len(sheets)
+            package.writestr('[Content_Types].xml', _XLSX_CONTENT_TYPES.format(sheets=''.join(
+                f'<Override PartName="/xl/worksheets/sheet{number}.xml" '
+                f'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+                for number in range(1, sheet_count + 1)
+            )))
+            package.writestr('_rels/.rels', _XLSX_ROOT_RELS)
+            package.writestr('xl/workbook.xml', _XLSX_WORKBOOK.format(sheets=''.join(
+                f'<sheet name={quoteattr(sheet_name)} sheetId="{number}" r:id="rId{number}"/>'
+                for number, (sheet_name, _, _) in enumerate(sheets, start=1)
+            )))
+            package.writestr('xl/_rels/workbook.xml.rels', _XLSX_WORKBOOK_RELS.format(
+                sheets=''.join(
+                    f'<Relationship Id="rId{number}" Type="{_RELATIONSHIP_NS}/worksheet" '
+                    f'Target="worksheets/sheet{number}.xml"/>'
+                    for number in range(1, sheet_count + 1)
+                ),
+                styles_id=sheet_count + 1,
+                strings_id=sheet_count + 2
+            ))
+            package.writestr('xl/styles.xml', _XLSX_STYLES)
+            
+    def _container_rows(self, columns: Dict[str, np.ndarray]) -> Iterator[tuple]:
+        """
+        Generate the rows of a container sheet.
+        
+        Args:
+            columns: Metric columns of the container inside the time range
+            
+        Yields:
+            (timestamp, cpu, memory, memory_mb, network_rx_kb, network_tx_kb) tuples
+        """
+        fromtimestamp = datetime.datetime.fromtimestamp
+        for timestamp, *values in zip(*_converted_columns(columns)):
+            yield (fromtimestamp(timestamp), *values)
+            
+    def _summary_row(self, container_id: str, container_name: str, columns: Dict[str, np.ndarray]) -> tuple:
+        """
+        Build the summary sheet row of a container.
+        
+        Args:
+            container_id: Container ID
+            container_name: Container display name
+            columns: Metric columns of the container inside the time range
+            
+        Returns:
+            Row matching SUMMARY_SHEET_HEADER
+        """
+        # Calculate summary statistics
+        avg_cpu, max_cpu, avg_memory, max_memory = self.summarize_metrics(container_id, columns)
+        
+        return (
+            container_id[:12],
+            container_name,
+            round(avg_cpu, 2),
+            round(max_cpu, 2),
+            round(avg_memory, 2),
+            round(max_memory, 2),
+            len(columns['timestamp'])
+        )
+        
+    def _info_rows(self,
+                   container_ids: List[str],
+                   start_time: datetime.datetime,
+                   end_time: datetime.datetime) -> Tuple[tuple, ...]:
+        """Build the rows of the report information sheet."""
+        return (
+            ('Generated At', datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')),
+            ('Time Range', f"{start_time.strftime('%Y-%m-%d %H:%M:%S')} to {end_time.strftime('%Y-%m-%d %H:%M:%S')}"),
+            ('Containers', len(container_ids)),
+            ('Generated By', 'Dockify')
+        )
+        
     def export_to_csv(self, 
                     filepath: str, 
                     container_ids: List[str], 
@@ -255,69 +613,33 @@ class MetricsExporter:
         """
         try:
             # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(os.path.abspath(filepath)), exist_ok=True)
+            _ensure_dir(os.path.dirname(os.path.abspath(filepath)))
             
-            # Open CSV file
-            with open(filepath, 'w', newline='') as csvfile:
+            # Open CSV file with a large write buffer so rows reach the disk in big blocks
+            with open(filepath, 'w', newline='', buffering=CSV_BUFFER_SIZE) as csvfile:
                 # Create CSV writer
-                writer = csv.writer(csvfile)
+                writer = csv.writer(csvfile, dialect='excel')
                 
                 # Write header
-                writer.writerow([
-                    'Container ID', 
-                    'Container Name', 
-                    'Timestamp', 
-                    'CPU (%)', 
-                    'Memory (%)', 
-                    'Memory Usage (MB)', 
-                    'Network RX (KB)', 
-                    'Network TX (KB)'
-                ])
+                writer.writerow(CSV_HEADER)
+                
+                # Metrics of all containers inside the time range, collected in one pass
+                metrics_by_container = self.fetch_all_metrics(container_ids, start_time, end_time)
+                display_names = _display_names(container_ids, container_names)
                 
                 # Process each container
                 for container_id in container_ids:
                     # Get container name
-                    container_name = container_names.get(container_id, container_id[:12])
-                    
-                    # Get metrics history
-                    metrics = self.container_monitor.get_metrics_history(container_id)
+                    container_name = display_names[container_id]
                     
-                    # Filter metrics by time range
-                    start_timestamp = start_time.timestamp()
-                    end_timestamp = end_time.timestamp()
+                    columns = metrics_by_container[container_id]
                     
-                    filtered_metrics = [
-                        m for m in metrics 
-                        if start_timestamp <= m.get('timestamp', 0) <= end_timestamp
-                    ]
-                    
-                    if not filtered_metrics:
+                    if not len(columns['timestamp']):
                         logger.warning(f"No metrics found for container {container_id} in the specified time range")
                         continue
                         
-                    # Write metrics
-                    for metric in filtered_metrics:
-                        timestamp = datetime.datetime.fromtimestamp(metric.get('timestamp', 0))
-                        cpu_percent = round(metric.get('cpu_percent', 0), 2)
-                        memory_percent = round(metric.get('memory_percent', 0), 2)
-                        
-                        # Convert memory to MB
-                        memory_mb = round(metric.get('memory_usage', 0) / (1024 * 1024), 2)
-                        
-                        # Convert network to KB
-                        network_rx_kb = round(metric.get('network_rx', 0) / 1024, 2)
-                        network_tx_kb = round(metric.get('network_tx', 0) / 1024, 2)
-                        
-                        writer.writerow([
-                            container_id[:12],
-                            container_name,
-                            timestamp.strftime('%Y-%m-%d %H:%M:%S'),
-                            cpu_percent,
-                            memory_percent,
-                            memory_mb,
-                            network_rx_kb,
-                            network_tx_kb
-                        ])
+                    # Rows are generated while the writer consumes them, no intermediate row list is built
+                    writer.writerows(self._csv_rows(container_id, container_name, columns))
                         
             return True
             
@@ -325,6 +647,361 @@ class MetricsExporter:
             logger.error(f"Error exporting to CSV: {e}")
             return False
             
+    def _csv_rows(self, container_id: str, container_name: str, columns: Dict[str, np.ndarray]) -> Iterator[tuple]:
+        """
+        Generate the CSV rows of a container.
+        
+        Args:
+            container_id: Container ID
+            container_name: Container display name
+            columns: Metric columns of the container inside the time range
+            
+        Yields:
+            Rows matching CSV_HEADER
+        """
+        short_id = container_id[:12]
+        fromtimestamp = datetime.datetime.fromtimestamp
+        for timestamp, *values in zip(*_converted_columns(columns)):
+            # isoformat gives the same "YYYY-MM-DD HH:MM:SS" text without parsing a format string
+            yield (short_id, container_name, fromtimestamp(timestamp).isoformat(' ', 'seconds'), *values)
+            
+    def summarize_metrics(self, container_id: str, columns: Dict[str, np.ndarray]) -> Tuple[float, float, float, float]:
+        """
+        Compute average and maximum CPU and memory usage of time-ordered metrics.
+        
+        Sums and maxima are cached per AGGREGATE_RESOLUTION-second bucket, so reports over
+        overlapping ranges only aggregate the buckets whose contents changed.
+        
+        Args:
+            container_id: Container ID the metrics belong to
+            columns: Metric columns of the container, ordered by timestamp
+            
+        Returns:
+            Tuple of (avg_cpu, max_cpu, avg_memory, max_memory)
+        """
+        timestamps = columns['timestamp']
+        if not len(timestamps):
+            return 0, 0, 0, 0
+            
+        cpu = columns['cpu_percent']
+        memory = columns['memory_percent']
+        
+        # Bucket boundaries in one vector pass: indexes where the bucket start changes
+        bucket_starts = timestamps // AGGREGATE_RESOLUTION * AGGREGATE_RESOLUTION
+        bounds = [0, *(np.flatnonzero(np.diff(bucket_starts)) + 1).tolist(), len(timestamps)]
+        
+        cache = self._aggregate_cache
+        count = 0
+        cpu_sum = memory_sum = 0.0
+        cpu_max = memory_max = float('-inf')
+        
+        with self._aggregate_lock:
+            for lo, hi in zip(bounds, bounds[1:]):
+                # История только дописывается в конец и обрезается с начала, поэтому совпадение
+                # количества и крайних меток означает те же самые точки
+                key = (container_id, AGGREGATE_RESOLUTION, float(bucket_starts[lo]))
+                first_timestamp = float(timestamps[lo])
+                last_timestamp = float(timestamps[hi - 1])
+                entry = cache.get(key)
+                if entry is None or entry[:3] != (hi - lo, first_timestamp, last_timestamp):
+                    entry = (
+                        hi - lo, first_timestamp, last_timestamp,
+                        float(cpu[lo:hi].sum()), float(cpu[lo:hi].max()),
+                        float(memory[lo:hi].sum()), float(memory[lo:hi].max())
+                    )
+                    cache[key] = entry
+                    if len(cache) > AGGREGATE_CACHE_SIZE:
+                        cache.popitem(last=False)
+                else:
+                    cache.move_to_end(key)
+                    
+                count += entry[0]
+                cpu_sum += entry[3]
+                cpu_max = max(cpu_max, entry[4])
+                memory_sum += entry[5]
+                memory_max = max(memory_max, entry[6])
+                
+        return cpu_sum / count, cpu_max, memory_sum / count, memory_max
+        
+    def fetch_all_metrics(self,
+                          container_ids: List[str],
+                          start_time: datetime.datetime,
+                          end_time: datetime.datetime) -> Dict[str, Dict[str, np.ndarray]]:
+        """
+        Collect metrics of all containers inside the time range in one pass.
+        
+        Args:
+            container_ids: List of container IDs
+            start_time: Start time for metrics
+            end_time: End time for metrics
+            
+        Returns:
+            Mapping of container IDs to their metric columns inside the time range
+        """
+        start_timestamp = start_time.timestamp()
+        end_timestamp = end_time.timestamp()
+        
+        return {
+            container_id: self._fetch_metrics(container_id, start_timestamp, end_timestamp)
+            for container_id in container_ids
+        }
+        
+    def _fetch_metrics(self, container_id: str, start_timestamp: float, end_timestamp: float) -> Dict[str, np.ndarray]:
+        """
+        Get the metric columns of a container inside the time range.
+        
+        Args:
+            container_id: Container ID
+            start_timestamp: Start of the range, POSIX timestamp
+            end_timestamp: End of the range, POSIX timestamp
+            
+        Returns:
+            Metric columns sliced to the time range
+        """
+        columns = self._history(container_id)
+        timestamps = columns['timestamp']
+        # История упорядочена по времени: границы диапазона ищутся бинарным поиском,
+        # а колонки режутся срезами без копирования
+        lo = int(timestamps.searchsorted(start_timestamp, side='left'))
+        hi = int(timestamps.searchsorted(end_timestamp, side='right'))
+        return {field: column[lo:hi] for field, column in columns.items()}
+        
+    def _history(self, container_id: str) -> Dict[str, np.ndarray]:
+        """
+        Get the full history columns of a container, reusing a copy younger than HISTORY_CACHE_TTL.
+        
+        Args:
+            container_id: Container ID
+            
+        Returns:
+            Metric columns, see ContainerMonitor.get_metrics_history_columns
+        """
+        now = time.monotonic()
+        with self._history_lock:
+            entry = self._history_cache.get(container_id)
+            if entry is not None and now - entry[0] < HISTORY_CACHE_TTL:
+                self._history_cache.move_to_end(container_id)
+                return entry[1]
+                
+        # Колонки строятся без блокировки, чтобы разные контейнеры читались параллельно
+        columns = self.container_monitor.get_metrics_history_columns(container_id)
+        
+        with self._history_lock:
+            self._history_cache[container_id] = (now, columns)
+            self._history_cache.move_to_end(container_id)
+            while len(self._history_cache) > HISTORY_CACHE_SIZE:
+                self._history_cache.popitem(last=False)
+                
+        return columns
+        
+    def _container_payload(self,
+                           container_id: str,
+                           start_timestamp: float,
+                           end_timestamp: float) -> Tuple[Dict[str, np.ndarray], Tuple[List[float], ...]]:
+        """
+        Fetch and convert the sheet data of one container.
+        
+        Runs on worker threads: apart from the locked history cache it must not touch
+        shared exporter state such as the result and aggregate caches.
+        
+        Args:
+            container_id: Container ID
+            start_timestamp: Start of the range, POSIX timestamp
+            end_timestamp: End of the range, POSIX timestamp
+            
+        Returns:
+            (columns, converted_columns) tuple, see _fetch_metrics and _converted_columns
+        """
+        columns = self._fetch_metrics(container_id, start_timestamp, end_timestamp)
+        return columns, _converted_columns(columns)
+        
+    def count_rows(self,
+                   container_ids: List[str],
+                   start_time: datetime.datetime,
+                   end_time: datetime.datetime) -> Dict[str, int]:
+        """
+        Count metrics of each container inside the time range.
+        
+        Args:
+            container_ids: List of container IDs
+            start_time: Start time for metrics
+            end_time: End time for metrics
+            
+        Returns:
+            Mapping of container IDs to row counts
+        """
+        return {
+            container_id: len(columns['timestamp'])
+            for container_id, columns in self.fetch_all_metrics(container_ids, start_time, end_time).items()
+        }
+        
+    def export_segmented(self,
+                         export: Callable[..., bool],
+                         filepath: str,
+                         container_ids: List[str],
+                         container_names: Dict[str, str],
+                         start_time: datetime.datetime,
+                         end_time: datetime.datetime,
+                         segment_size: int = SEGMENT_SIZE) -> str:
+        """
+        Export metrics, splitting the report into parts when it exceeds segment_size rows.
+        
+        Parts are named "<name>_partNNN<ext>" and packed into "<name>.zip". A container is
+        never split between parts, so a part may exceed segment_size when one container does.
+        A report identical to one generated within RESULT_CACHE_TTL seconds is copied instead,
+        unless its range reaches into the future and may have gained samples since.
+        
+        Args:
+            export: Export method to call for each file (export_to_excel, export_to_csv or a partial of them)
+            filepath: Path to save the report
+            container_ids: List of container IDs to include
+            container_names: Mapping of container IDs to display names
+            start_time: Start time for metrics
+            end_time: End time for metrics
+            segment_size: Maximum number of rows per part
+            
+        Returns:
+            Path to the report or to the archive of its parts, empty string if failed
+        """
+        # Ranges ending after now (rounded up to a bucket) still receive new samples, so they are never reused
+        cacheable = end_time.timestamp() <= time.time()
+        
+        # Same writer, options, containers and range as a recent report: copy it instead of regenerating
+        cache_key = (
+            getattr(export, 'func', export),
+            tuple(sorted(getattr(export, 'keywords', {}).items())),
+            tuple(sorted(container_ids)),
+            tuple(sorted(container_names.items())),
+            start_time,
+            end_time,
+            segment_size
+        )
+        cached_path = self._get_cached_report(cache_key, filepath) if cacheable else ""
+        if cached_path:
+            return cached_path
+            
+        report_path = self._export_segments(
+            export, filepath, container_ids, container_names, start_time, end_time, segment_size
+        )
+        if report_path and cacheable:
+            self._result_cache[cache_key] = (time.monotonic(), report_path)
+            self._result_cache.move_to_end(cache_key)
+            while len(self._result_cache) > RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+        return report_path
+        
+    def _get_cached_report(self, cache_key: tuple, filepath: str) -> str:
+        """
+        Copy a recently generated report matching cache_key to filepath.
+        
+        Args:
+            cache_key: Report request key
+            filepath: Path the new report was requested at
+            
+        Returns:
+            Path to the copied report, empty string if there is no usable cached report
+        """
+        entry = self._result_cache.get(cache_key)
+        if entry is None:
+            return ""
+            
+        created_at, cached_path = entry
+        if time.monotonic() - created_at > RESULT_CACHE_TTL or not os.path.exists(cached_path):
+            del self._result_cache[cache_key]
+            return ""
+            
+        # Сегментированный отчет кэширован как архив
+        target_path = os.path.splitext(filepath)[0] + os.path.splitext(cached_path)[1]
+        try:
+            if os.path.abspath(target_path) != os.path.abspath(cached_path):
+                shutil.copyfile(cached_path, target_path)
+        except OSError as e:
+            logger.error(f"Error copying cached report: {e}")
+            return ""
+            
+        logger.info(f"Reused report {cached_path} for {target_path}")
+        return target_path
+        
+    def _export_part(self,
+                     export: Callable[..., bool],
+                     filepath: str,
+                     container_ids: List[str],
+                     container_names: Dict[str, str],
+                     start_time: datetime.datetime,
+                     end_time: datetime.datetime) -> bool:
+        """Write one part of a segmented report without starting nested worker pools."""
+        self._part_context.active = True
+        try:
+            return export(filepath, container_ids, container_names, start_time, end_time)
+        finally:
+            self._part_context.active = False
+            
+    def _export_segments(self,
+                         export: Callable[..., bool],
+                         filepath: str,
+                         container_ids: List[str],
+                         container_names: Dict[str, str],
+                         start_time: datetime.datetime,
+                         end_time: datetime.datetime,
+                         segment_size: int) -> str:
+        """Write the report, split into a zip of parts when it exceeds segment_size rows."""
+        row_counts = self.count_rows(container_ids, start_time, end_time)
+        
+        if sum(row_counts.values()) <= segment_size:
+            if export(filepath, container_ids, container_names, start_time, end_time):
+                return filepath
+            return ""
+            
+        # Group containers into parts of at most segment_size rows
+        segments = []
+        current_segment = []
+        current_rows = 0
+        for container_id in container_ids:
+            rows = row_counts[container_id]
+            if current_segment and current_rows + rows > segment_size:
+                segments.append(current_segment)
+                current_segment = []
+                current_rows = 0
+            current_segment.append(container_id)
+            current_rows += rows
+        if current_segment:
+            segments.append(current_segment)
+            
+        base_path, extension = os.path.splitext(filepath)
+        part_paths = [
+            f"{base_path}_part{part_number:03d}{extension}"
+            for part_number in range(1, len(segments) + 1)
+        ]
+        try:
+            # Parts are independent files; compression and file I/O release the GIL, so parts are written concurrently
+            with ThreadPoolExecutor(max_workers=min(SEGMENT_WORKERS, len(segments))) as executor:
+                results = list(executor.map(
+                    lambda part: self._export_part(export, part[0], part[1], container_names, start_time, end_time),
+                    zip(part_paths, segments)
+                ))
+            if not all(results):
+                return ""
+                
+            archive_path = base_path + '.zip'
+            with zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_DEFLATED) as archive:
+                for part_path in part_paths:
+                    archive.write(part_path, os.path.basename(part_path))
+                    
+            logger.info(f"Report split into {len(part_paths)} parts: {archive_path}")
+            return archive_path
+            
+        except Exception as e:
+            logger.error(f"Error exporting segmented report: {e}")
+            return ""
+            
+        finally:
+            # Части уже упакованы в архив (или экспорт не удался)
+            for part_path in part_paths:
+                try:
+                    os.remove(part_path)
+                except OSError:
+                    pass
+                    
     def export_daily_report(self, output_dir: str, container_ids: List[str] = None) -> str:
         """
         Generate a daily report for all or specified containers.
@@ -338,7 +1015,7 @@ class MetricsExporter:
         """
         try:
             # Create directory if it doesn't exist
-            os.makedirs(output_dir, exist_ok=True)
+            _ensure_dir(os.path.abspath(output_dir))
             
             # Generate filename
             now = datetime.datetime.now()
@@ -2,14 +2,26 @@
 Глобальные переменные и настройки для приложения Dockify.
 """
 
-# Флаг для отключения изображений (используется в демо-режиме)
-DISABLE_IMAGES = False
+class _Flags:
+    """
+    Изменяемые флаги приложения.
+    
+    Читатели импортируют сам объект FLAGS, а не значения флагов,
+    поэтому всегда видят текущее значение.
+    """
+    __slots__ = ('disable_images',)
+    
+    def __init__(self):
+        # Флаг для отключения изображений (используется в демо-режиме)
+        self.disable_images: bool = False
+
+FLAGS = _Flags()
 
 def set_disable_images(value: bool):
     """
-    Установить значение флага DISABLE_IMAGES.
+    Установить значение флага FLAGS.disable_images.
     
     Args:
         value: Новое значение флага
     """
-    global DISABLE_IMAGES 
\ No newline at end of file
+    FLAGS.disable_images = bool(value)
@@ -3,13 +3,18 @@ Theme utilities for Dockify.
 Defines colors, styling functions, and theme-related utilities for the application.
 """
 import logging
-import tkinter as tk
-from typing import Dict, Any, Optional
+import string
+import functools
+from tkinter import ttk
+from types import MappingProxyType
+from typing import Callable, Dict, Any, Iterable, List, Optional
+
+import numpy as np
 
 logger = logging.getLogger('dockify.utils.theme')
 
-# Spotify-inspired color palette
-SPOTIFY_COLORS = {
+# Spotify-inspired color palette, read-only
+SPOTIFY_COLORS = MappingProxyType({
     # Main colors
     "background": "#121212",  # Main app background
     "card_background": "#181818",  # Card/panel background
@@ -32,50 +37,48 @@ SPOTIFY_COLORS = {
     "border": "#333333",  # Border color
     "hover": "#282828",  # Hover state
     "selection": "#262626",  # Selected item
-}
+})
+
+# Frequently used palette entries as plain module constants
+BACKGROUND = SPOTIFY_COLORS["background"]
+ACCENT = SPOTIFY_COLORS["accent"]
+
+# Palette as RGB tuples, parsed once at import
+SPOTIFY_RGB = MappingProxyType({
+    name: (int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16))
+    for name, color in SPOTIFY_COLORS.items()
+})
+
+# Background channels that semi-transparent colors are blended with
+_BG_R, _BG_G, _BG_B = SPOTIFY_RGB["background"]
+
+# Two-digit hex text of every channel value, so formatting is plain concatenation
+_HEX = tuple(f"{i:02x}" for i in range(256))
+
+# Set once the theme is applied; later apply_theme calls send nothing to Tcl
+_APPLIED = False
 
 def apply_theme(root):
     """
     Apply the Spotify-inspired theme to the application.
     
+    Only the first call configures ttk; use force_reapply_theme to apply it again.
+    
     Args:
         root: The root or toplevel window
     """
-    try:
-        # Configure tkinter styles
-        style = tk.ttk.Style()
-        
-        # Configure ttk styles
-        style.configure("TButton", 
-                       background=SPOTIFY_COLORS["accent"],
-                       foreground=SPOTIFY_COLORS["text_bright"],
-                       padding=8,
-                       font=("Helvetica", 11))
-        
-        style.map("TButton",
-                 background=[("active", lighten_color(SPOTIFY_COLORS["accent"], 0.1))],
-                 foreground=[("active", SPOTIFY_COLORS["text_bright"])])
+    global _APPLIED
+    if _APPLIED:
+        return
         
-        style.configure("TLabel", 
-                       background=SPOTIFY_COLORS["background"],
-                       foreground=SPOTIFY_COLORS["text_standard"],
-                       font=("Helvetica", 11))
-        
-        # Configure ttk.Treeview
-        style.configure("Treeview", 
-                      background=SPOTIFY_COLORS["card_background"],
-                      foreground=SPOTIFY_COLORS["text_bright"],
-                      fieldbackground=SPOTIFY_COLORS["card_background"],
-                      font=("Helvetica", 11))
-        
-        style.configure("Treeview.Heading", 
-                      background=SPOTIFY_COLORS["card_background"],
-                      foreground=SPOTIFY_COLORS["text_subtle"],
-                      font=("Helvetica", 12, "bold"))
+    try:
+        style = ttk.Style(root)
         
-        style.map("Treeview", 
-                background=[("selected", SPOTIFY_COLORS["accent"])],
-                foreground=[("selected", SPOTIFY_COLORS["text_bright"])])
+        # All styles reach Tcl in one theme_create call; the theme is created once per interpreter
+        if THEME_NAME not in style.theme_names():
+            style.theme_create(THEME_NAME, parent=style.theme_use(), settings=_THEME_SETTINGS)
+        style.theme_use(THEME_NAME)
+        _APPLIED = True
         
         # Other configurations as needed
         logger.info("Applied Spotify-inspired theme to the application")
@@ -84,6 +87,134 @@ def apply_theme(root):
         logger.error(f"Error applying theme: {e}")
 
 
+def force_reapply_theme(root):
+    """
+    Apply the theme again, re-sending all style settings to ttk.
+    
+    Args:
+        root: The root or toplevel window
+    """
+    global _APPLIED
+    _APPLIED = False
+    
+    try:
+        style = ttk.Style(root)
+        if THEME_NAME in style.theme_names():
+            style.theme_settings(THEME_NAME, _THEME_SETTINGS)
+    except Exception as e:
+        logger.error(f"Error reapplying theme: {e}")
+        
+    apply_theme(root)
+
+
+def _lighten_rgb(rgb: tuple, factor: float) -> tuple:
+    """Move each RGB channel towards 255 by a factor."""
+    r, g, b = rgb
+    return (
+        min(255, int(r + (255 - r) * factor)),
+        min(255, int(g + (255 - g) * factor)),
+        min(255, int(b + (255 - b) * factor))
+    )
+
+
+def _multiply_rgb(rgb: tuple, multiplier: float) -> tuple:
+    """Multiply each RGB channel, clamping at 0."""
+    r, g, b = rgb
+    return (
+        max(0, int(r * multiplier)),
+        max(0, int(g * multiplier)),
+        max(0, int(b * multiplier))
+    )
+
+
+def _blend_rgb(rgb: tuple, opacity: float) -> tuple:
+    """Blend RGB channels with the background (this just simulates opacity for our theme calculations)."""
+    r, g, b = rgb
+    inverse = 1 - opacity
+    return (
+        int(r * opacity + _BG_R * inverse),
+        int(g * opacity + _BG_G * inverse),
+        int(b * opacity + _BG_B * inverse)
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _scale_impl(factor: float, opacity: float) -> Callable[[tuple], tuple]:
+    """
+    Build the channel transform of scale_color for a (factor, opacity) pair.
+    
+    The factor and opacity branches are resolved once per pair; the returned
+    function is straight-line code for every color scaled with that pair.
+    
+    Args:
+        factor: Scaling factor (lighter > 1.0, darker < 1.0)
+        opacity: Opacity factor (0.0 to 1.0)
+        
+    Returns:
+        Function mapping an RGB tuple to the scaled RGB tuple
+    """
+    if factor > 1.0:
+        # Lighten
+        amount = factor - 1.0
+        scale = lambda rgb: _lighten_rgb(rgb, amount)
+    elif factor < 1.0:
+        # Darken
+        scale = lambda rgb: _multiply_rgb(rgb, factor)
+    else:
+        scale = None
+        
+    if opacity >= 1.0:
+        return scale or (lambda rgb: rgb)
+    if scale is None:
+        return lambda rgb: _blend_rgb(rgb, opacity)
+    return lambda rgb: _blend_rgb(scale(rgb), opacity)
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_hex(color: str) -> Optional[tuple]:
+    """
+    Parse a "#RRGGBB" hex color to an RGB tuple.
+    
+    Args:
+        color: Hex color string (e.g., "#1DB954")
+        
+    Returns:
+        (r, g, b) tuple, or None if the color has another format
+    """
+    # The result is cached, so the warning is logged once per invalid color
+    if not color.startswith('#') or len(color) != 7 or color[1:].strip(string.hexdigits):
+        logger.warning(f"Invalid color format: {color}")
+        return None
+    value = int(color[1:], 16)
+    return value >> 16, value >> 8 & 0xFF, value & 0xFF
+
+
+def _to_hex(rgb: tuple) -> str:
+    """Convert an RGB tuple to a "#rrggbb" string, clamping each channel to 0..255."""
+    r, g, b = rgb
+    return "#" + _HEX[min(255, max(0, r))] + _HEX[min(255, max(0, g))] + _HEX[min(255, max(0, b))]
+
+
+# Color helpers are pure and called with the same palette arguments by every widget, so results are memoized.
+# Only parsed colors reach these caches, and _to_hex clamps whatever factor the caller passes
+@functools.lru_cache(maxsize=256)
+def _lighten_hex(rgb: tuple, factor: float) -> str:
+    """Cached core of lighten_color."""
+    return _to_hex(_lighten_rgb(rgb, factor))
+
+
+@functools.lru_cache(maxsize=256)
+def _darken_hex(rgb: tuple, factor: float) -> str:
+    """Cached core of darken_color."""
+    return _to_hex(_multiply_rgb(rgb, 1 - factor))
+
+
+@functools.lru_cache(maxsize=256)
+def _scale_hex(rgb: tuple, factor: float, opacity: float) -> str:
+    """Cached core of scale_color."""
+    return _to_hex(_scale_impl(factor, opacity)(rgb))
+
+
 def lighten_color(color: str, factor: float = 0.2) -> str:
     """
     Lighten a hex color by a factor.
@@ -95,27 +226,10 @@ def lighten_color(color: str, factor: float = 0.2) -> str:
     Returns:
         Lightened hex color string
     """
-    # Make sure color is a valid hex string
-    if not color.startswith('#') or len(color) != 7:
-        logger.warning(f"Invalid color format: {color}")
-        return color
-    
-    try:
-        # Convert hex to RGB
-        r = int(color[1:3], 16)
-        g = int(color[3:5], 16)
-        b = int(color[5:7], 16)
-        
-        # Lighten each component
-        r = min(255, int(r + (255 - r) * factor))
-        g = min(255, int(g + (255 - g) * factor))
-        b = min(255, int(b + (255 - b) * factor))
-        
-        # Convert back to hex
-        return f"#{r:02x}{g:02x}{b:02x}"
-    except Exception as e:
-        logger.error(f"Error lightening color {color}: {e}")
+    rgb = _parse_hex(color)
+    if rgb is None:
         return color
+    return _lighten_hex(rgb, factor)
 
 
 def darken_color(color: str, factor: float = 0.2) -> str:
@@ -129,27 +243,10 @@ def darken_color(color: str, factor: float = 0.2) -> str:
     Returns:
         Darkened hex color string
     """
-    # Make sure color is a valid hex string
-    if not color.startswith('#') or len(color) != 7:
-        logger.warning(f"Invalid color format: {color}")
-        return color
-    
-    try:
-        # Convert hex to RGB
-        r = int(color[1:3], 16)
-        g = int(color[3:5], 16)
-        b = int(color[5:7], 16)
-        
-        # Darken each component
-        r = max(0, int(r * (1 - factor)))
-        g = max(0, int(g * (1 - factor)))
-        b = max(0, int(b * (1 - factor)))
-        
-        # Convert back to hex
-        return f"#{r:02x}{g:02x}{b:02x}"
-    except Exception as e:
-        logger.error(f"Error darkening color {color}: {e}")
+    rgb = _parse_hex(color)
+    if rgb is None:
         return color
+    return _darken_hex(rgb, factor)
 
 
 def scale_color(color: str, factor: float = 1.0, opacity: float = 1.0) -> str:
@@ -164,43 +261,119 @@ def scale_color(color: str, factor: float = 1.0, opacity: float = 1.0) -> str:
     Returns:
         Scaled hex color string
     """
-    # Make sure color is a valid hex string
-    if not color.startswith('#') or len(color) != 7:
-        logger.warning(f"Invalid color format: {color}")
+    rgb = _parse_hex(color)
+    if rgb is None:
         return color
+    return _scale_hex(rgb, factor, opacity)
+
+
+def _palette_array(colors: Iterable[str]) -> np.ndarray:
+    """Convert "#RRGGBB" colors to an (N, 3) array of channels."""
+    data = bytes.fromhex(''.join(color[1:] for color in colors))
+    return np.frombuffer(data, dtype=np.uint8).reshape(-1, 3).astype(np.float64)
+
+
+def _palette_hex(channels: np.ndarray) -> List[str]:
+    """Convert an (N, 3) array of channels back to "#rrggbb" colors, truncating and clamping like _to_hex."""
+    digits = np.clip(np.trunc(channels), 0, 255).astype(np.uint8).tobytes().hex()
+    return ['#' + digits[i:i + 6] for i in range(0, len(digits), 6)]
+
+
+def lighten_palette(colors: Iterable[str], factor: float = 0.2) -> List[str]:
+    """
+    Lighten many hex colors at once.
     
-    try:
-        # Convert hex to RGB
-        r = int(color[1:3], 16)
-        g = int(color[3:5], 16)
-        b = int(color[5:7], 16)
-        
-        # Scale each component
-        if factor > 1.0:
-            # Lighten
-            r = min(255, int(r + (255 - r) * (factor - 1.0)))
-            g = min(255, int(g + (255 - g) * (factor - 1.0)))
-            b = min(255, int(b + (255 - b) * (factor - 1.0)))
-        elif factor < 1.0:
-            # Darken
-            r = max(0, int(r * factor))
-            g = max(0, int(g * factor))
-            b = max(0, int(b * factor))
+    Same result as lighten_color for each color, computed as one array operation.
+    
+    Args:
+        colors: Valid hex color strings (e.g., "#1DB954")
+        factor: Lightening factor (0.0 to 1.0)
         
-        # Apply opacity (this just simulates opacity for our theme calculations)
-        if opacity < 1.0:
-            bg_color = int(SPOTIFY_COLORS["background"][1:3], 16)
-            r = int(r * opacity + bg_color * (1 - opacity))
-            g = int(g * opacity + bg_color * (1 - opacity))
-            b = int(b * opacity + bg_color * (1 - opacity))
+    Returns:
+        Lightened hex color strings, in input order
+    """
+    channels = _palette_array(colors)
+    return _palette_hex(channels + (255 - channels) * factor)
+
+
+def darken_palette(colors: Iterable[str], factor: float = 0.2) -> List[str]:
+    """
+    Darken many hex colors at once.
+    
+    Same result as darken_color for each color, computed as one array operation.
+    
+    Args:
+        colors: Valid hex color strings (e.g., "#1DB954")
+        factor: Darkening factor (0.0 to 1.0)
         
-        # Convert back to hex
-        return f"#{r:02x}{g:02x}{b:02x}"
-    except Exception as e:
-        logger.error(f"Error scaling color {color}: {e}")
-        return color
+    Returns:
+        Darkened hex color strings, in input order
+    """
+    return _palette_hex(_palette_array(colors) * (1 - factor))
+
+
+# Shade factors precomputed for every palette color
+THEME_SHADE_FACTORS = (0.1, 0.2)
+
+# Derived shades, computed once at import: (color_name, "light" | "dark", factor) -> hex color
+# Each (kind, factor) ramp of the whole palette is one batched array operation
+THEME_CACHE = MappingProxyType({
+    (name, kind, factor): shade
+    for kind, transform in (("light", lighten_palette), ("dark", darken_palette))
+    for factor in THEME_SHADE_FACTORS
+    for name, shade in zip(SPOTIFY_COLORS, transform(SPOTIFY_COLORS.values(), factor))
+})
+
+
+# ttk theme created by apply_theme
+THEME_NAME = "dockify"
+
+# ttk style settings of the theme, built once at import
+_THEME_SETTINGS = {
+    "TButton": {
+        "configure": {
+            "background": ACCENT,
+            "foreground": SPOTIFY_COLORS["text_bright"],
+            "padding": 8,
+            "font": ("Helvetica", 11)
+        },
+        "map": {
+            "background": [("active", THEME_CACHE[("accent", "light", 0.1)])],
+            "foreground": [("active", SPOTIFY_COLORS["text_bright"])]
+        }
+    },
+    "TLabel": {
+        "configure": {
+            "background": BACKGROUND,
+            "foreground": SPOTIFY_COLORS["text_standard"],
+            "font": ("Helvetica", 11)
+        }
+    },
+    # Configure ttk.Treeview
+    "Treeview": {
+        "configure": {
+            "background": SPOTIFY_COLORS["card_background"],
+            "foreground": SPOTIFY_COLORS["text_bright"],
+            "fieldbackground": SPOTIFY_COLORS["card_background"],
+            "font": ("Helvetica", 11)
+        },
+        "map": {
+            "background": [("selected", ACCENT)],
+            "foreground": [("selected", SPOTIFY_COLORS["text_bright"])]
+        }
+    },
+    "Treeview.Heading": {
+        "configure": {
+            "background": SPOTIFY_COLORS["card_background"],
+            "foreground": SPOTIFY_COLORS["text_subtle"],
+            "font": ("Helvetica", 12, "bold")
+        }
+    }
+}
 
 
+# Widgets ask for a handful of (size, bold) pairs; each pair always gets the same tuple object
+@functools.lru_cache(maxsize=32)
 def get_font(size: int, bold: bool = False) -> tuple:
     """
     Get a font tuple for consistent typography.
@@ -212,5 +385,4 @@ def get_font(size: int, bold: bool = False) -> tuple:
     Returns:
         Font tuple (family, size, weight)
     """
-    weight = "bold" if bold else "normal"
-    return ("Helvetica", size, weight)
+    return ("Helvetica", size, "bold" if bold else "normal")